@@ -1,4 +1,3 @@
-import os
 import copy
 import operator
 
@@ -111,7 +110,7 @@ class Rule:
     def _getFirstSelName(self):
         return '' if not self.selectors else sorted([s for s in self.selectors])[0]
 
-    def _toString(self, iParentSel=[], relation=' '):
+    def _iterString(self, iParentSel=[], relation=' '):
         if iParentSel:
             iParentSel = ['%s%s%s' % (ps, relation, ss) for ps in iParentSel for ss in self.selectors]
         else:
@@ -119,21 +118,20 @@ class Rule:
 
         iParentSel = sorted(iParentSel)
 
-        css = []
         if self.declarations:
-            css.append(''.join([','.join(iParentSel),
-                                '{' if iParentSel else '',
-                                ''.join(['%s:%s;' % (k,v) for k,v in sorted(self.declarations.items(), key=operator.itemgetter(0))]),
-                                '}' if iParentSel else '']))
+            yield ''.join([','.join(iParentSel),
+                           '{' if iParentSel else '',
+                           ''.join(['%s:%s;' % (k,v) for k,v in sorted(self.declarations.items(), key=operator.itemgetter(0))]),
+                           '}' if iParentSel else ''])
         for key, (rel, rules) in self.rules.items():
-            css.extend([rule._toString(iParentSel, rel) for rule in sorted(rules, key=lambda rule: rule._getFirstSelName())])
-
-        return ''.join(css)
+            for rule in sorted(rules, key=lambda rule: rule._getFirstSelName()):
+                for chunk in rule._iterString(iParentSel, rel):
+                    yield chunk
 
     def toString(self, uppercase=True):
-        return self._toString()
+        return html.markup(''.join(self._iterString()))
 
-    def _toPrettyString(self, iIndentChar='    ', iOffset='', iParentSel=[], relation=' '):
+    def _iterPrettyString(self, iIndentChar='    ', iOffset='', iParentSel=[], relation=' '):
         if iParentSel:
             iParentSel = ['%s%s%s' % (ps, relation, ss) for ps in iParentSel for ss in self.selectors]
         else:
@@ -141,19 +139,34 @@ class Rule:
 
         iParentSel = sorted(iParentSel)
 
-        css = []
+        first = True
         if self.declarations:
-            css.append('\n'.join(['%s%s' % (iOffset, ',\n'.join(iParentSel)),
-                                  '%s{' % (iOffset) if iParentSel else '',
-                                  '\n'.join(['%s%s%s: %s;' % (iOffset, iIndentChar,k,v) for k,v in sorted(self.declarations.items(), key=operator.itemgetter(0))]),
-                                  '%s}' % iOffset if iParentSel else ''])) 
+            yield '\n'.join(['%s%s' % (iOffset, ',\n'.join(iParentSel)),
+                             '%s{' % (iOffset) if iParentSel else '',
+                             '\n'.join(['%s%s%s: %s;' % (iOffset, iIndentChar,k,v) for k,v in sorted(self.declarations.items(), key=operator.itemgetter(0))]),
+                             '%s}' % iOffset if iParentSel else ''])
+            first = False
         for key, (rel, rules) in self.rules.items():
-            css.extend([rule._toPrettyString(iIndentChar, iOffset, iParentSel, rel) for rule in sorted(rules, key=lambda rule: rule._getFirstSelName())])
-
-        return '\n'.join(css)
+            for rule in sorted(rules, key=lambda rule: rule._getFirstSelName()):
+                if not first:
+                    yield '\n'
+                first = False
+                for chunk in rule._iterPrettyString(iIndentChar, iOffset, iParentSel, rel):
+                    yield chunk
 
     def toPrettyString(self, iIndentChar='    ', iOffset='', uppercase=True):
-        return self._toPrettyString(iIndentChar, iOffset)
+        return html.markup(''.join(self._iterPrettyString(iIndentChar, iOffset)))
+
+    def renderTo(self, iSink, iIndentChar='', iOffset='', uppercase=True, iBufferSize=html.BUFFER_SIZE):
+        '''
+        Write this rule to iSink, any object with a write method, in writes
+        of about iBufferSize characters.
+        '''
+        if iIndentChar:
+            chunks = self._iterPrettyString(iIndentChar, iOffset)
+        else:
+            chunks = self._iterString()
+        html.writeChunks(iSink, chunks, iBufferSize)
 
 
 class Css:
@@ -180,24 +193,35 @@ class Css:
             raise TypeError('invalid Rule object')
 
     def toString(self, uppercase=True):
-        return ''.join([rule.toString(uppercase) for rule in sorted(self.rules, key=lambda rule: rule._getFirstSelName())])
+        return html.markup(''.join([rule.toString(uppercase) for rule in sorted(self.rules, key=lambda rule: rule._getFirstSelName())]))
 
     def toPrettyString(self, iIndentChar='    ', iOffset='', uppercase=True):
-        return '\n'.join([rule.toPrettyString(iIndentChar, iOffset, uppercase) for rule in sorted(self.rules, key=lambda rule: rule._getFirstSelName())])
+        return html.markup('\n'.join([rule.toPrettyString(iIndentChar, iOffset, uppercase) for rule in sorted(self.rules, key=lambda rule: rule._getFirstSelName())]))
+
+    def _iterPrettyString(self, iIndentChar, iOffset, uppercase):
+        for i, rule in enumerate(sorted(self.rules, key=lambda rule: rule._getFirstSelName())):
+            if i:
+                yield '\n'
+            for chunk in rule._iterPrettyString(iIndentChar, iOffset):
+                yield chunk
+
+    def renderTo(self, iSink, iIndentChar='', iOffset='', uppercase=True, iBufferSize=html.BUFFER_SIZE):
+        '''
+        Write the style sheet to iSink, any object with a write method, in
+        writes of about iBufferSize characters.
+        '''
+        if iIndentChar:
+            chunks = self._iterPrettyString(iIndentChar, iOffset, uppercase)
+        else:
+            chunks = (chunk for rule in sorted(self.rules, key=lambda rule: rule._getFirstSelName())
+                            for chunk in rule._iterString())
+        html.writeChunks(iSink, chunks, iBufferSize)
 
     def toStyleTag(self):
         return html.STYLE(self)
 
     def save(self, iFilePath, iIndentChar='', iOffset='', uppercase=True):
-        dir = os.path.split(iFilePath)[0]
-        if dir and not os.path.exists(dir):
-            os.makedirs(dir)
-
-        with open(iFilePath, 'w') as f:
-            if iIndentChar:
-                f.write(self.toPrettyString(iIndentChar, iOffset, uppercase))
-            else:
-                f.write(self.toString(uppercase))
+        html.saveFile(iFilePath, lambda f: self.renderTo(f, iIndentChar, iOffset, uppercase))
 
 
 if __name__ == '__main__':
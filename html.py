@@ -1,6 +1,11 @@
 # -*- coding: utf-8 -*-
 import os
-from htmltags import *
+import sys
+import hashlib
+from itertools import chain
+from htmltagbase import *
+from htmltags import HEAD, BODY, HTML
+import htmltags
 
 
 class COMMENT(TagBase):
@@ -15,6 +20,8 @@ class COMMENT(TagBase):
     scripts and style elements to prevent older browsers, that do not support
     scripting or styles, from showing it as plain text.
     '''
+    __slots__ = ()
+
     def __init__(self, *comments):
         TagBase.__init__(self, "", *comments, stag='<!--', etag='-->', emptyTag=False)
 
@@ -31,12 +38,16 @@ class DOCTYPE(TagBase):
     specifies the rules for the markup language, so that the browsers render
     the content correctly.
     '''
+    __slots__ = ()
+
     def __init__(self, DTD):
         TagBase.__init__(self, "", DTD, stag='<!DOCTYPE ', etag='>', emptyTag=False)
 
 
 class PHP(TagBase):
 
+    __slots__ = ()
+
     def __init__(self, *codes):
         '''
         codes - [stuple of str] php codes.
@@ -125,7 +136,7 @@ class PAGE:
         for i, tag in enumerate(self.html.contents):
             if isinstance(tag, HEAD):
                 self.head = head
-                self.html.contents[i] = self.head
+                self.html.setContent(i, self.head)
                 break
 
     def setBody(self, body):
@@ -140,7 +151,7 @@ class PAGE:
         for i, tag in enumerate(self.html.contents):
             if isinstance(tag, BODY):
                 self.body = body
-                self.html.contents[i] = self.body
+                self.html.setContent(i, self.body)
                 break
 
     def getHtml(self):
@@ -153,29 +164,99 @@ class PAGE:
         return self.body
 
     def toString(self, uppercase=True):
-        return ''.join([self.doctype.toString(uppercase),
-                        self.html.toString(uppercase)])
+        return markup(''.join([self.doctype.toString(uppercase),
+                               self.html.toString(uppercase)]))
+
+    def fingerprint(self):
+        '''
+        Return a hex digest of the structure of the page, computed from the
+        fingerprints of DOCTYPE and HTML. See TagBase.fingerprint.
+        '''
+        return hashlib.sha1(self.doctype.fingerprint() + self.html.fingerprint()).hexdigest()
+
+    def etag(self, indentChar='', offset='', uppercase=True):
+        '''
+        Return a strong ETag of the markup of the page without rendering it.
+        Files included by addFromFile are checked on every call.
+
+        indentChar - [str] the indent the page is pretty printed with, or ''
+                     when it is served by toString or iterRender.
+        offset - [str] the indent of the pretty printed page.
+        uppercase - [bool] the case the page is served in.
+        '''
+        fingerprint = self.fingerprint()
+        if indentChar or offset:
+            fingerprint = hashlib.sha1('%s\0%r\0%r' % (fingerprint, indentChar, offset)).hexdigest()
+        return '"%s%s"' % ('' if uppercase else 'l', fingerprint)
+
+    def iterRender(self, uppercase=True, mapped=False):
+        '''
+        Yield the page markup chunk by chunk. See TagBase.iterRender.
+        The DOCTYPE, the start of HTML and the HEAD are followed by FLUSH, so
+        that a client can fetch what HEAD refers to while BODY is rendered.
+        '''
+        return chain(self.doctype.iterRender(uppercase),
+                     self.html.iterRender(uppercase, mapped, self.head))
+
+    def iterPrettyRender(self, indentChar='    ', offset='', uppercase=True):
+        '''
+        Yield the indented page markup chunk by chunk. The joined chunks are
+        identical to toPrettyString(). Like in iterRender, the HEAD is
+        followed by FLUSH.
+        '''
+        return chain([self.doctype.toString(uppercase), '\n'],
+                     self.html.iterPrettyRender(indentChar, offset, uppercase, self.head))
 
     def toPrettyString(self, indentChar='    ', offset='', uppercase=True):
-        return '\n'.join([self.doctype.toString(uppercase),
-                          self.html.toPrettyString(indentChar, offset, uppercase)])
+        return markup('\n'.join([self.doctype.toString(uppercase),
+                                 self.html.toPrettyString(indentChar, offset, uppercase)]))
+
+    def renderTo(self, sink, indentChar='', offset='', uppercase=True, bufferSize=BUFFER_SIZE):
+        '''
+        Write the page to sink without building it as a whole.
+        See TagBase.renderTo.
+        '''
+        if indentChar:
+            chunks = self.iterPrettyRender(indentChar, offset, uppercase)
+        else:
+            chunks = self.iterRender(uppercase, mapped=True)
+        writeChunks(sink, chunks, bufferSize)
+
+    def renderToStream(self, writer, indentChar='', offset='', uppercase=True, chunkSize=None,
+                       encoding='utf-8'):
+        '''
+        Return a coroutine writing the page to an asyncio stream writer
+        without blocking the event loop. See TagBase.renderToStream.
+        '''
+        import htmlasync
+        if chunkSize is None:
+            chunkSize = htmlasync.STREAM_CHUNK_SIZE
+        return htmlasync.renderToStream(self, writer, indentChar, offset, uppercase, chunkSize, encoding)
 
-    def save(self, filePath, indentChar='', offset='', uppercase=True):
-        dir = os.path.split(filePath)[0]
-        if dir and not os.path.exists(dir):
-            os.makedirs(dir)
+    def compile(self, indentChar='', offset='', uppercase=True):
+        '''
+        Return a Template of the page with its slots left to be filled when
+        it is rendered. See htmltemplate.compile.
+        '''
+        import htmltemplate
+        return htmltemplate.compile(self, indentChar, offset, uppercase)
+
+    def save(self, filePath, indentChar='', offset='', uppercase=True, bufferSize=BUFFER_SIZE):
+        '''
+        Write the page to filePath, which is only replaced once the whole page
+        is written (see saveFile).
+        '''
+        saveFile(filePath, lambda f: self.renderTo(f, indentChar, offset, uppercase, bufferSize))
 
-        with open(filePath, 'w') as f:
-            if indentChar:
-                page = self.toPrettyString(indentChar, offset, uppercase)
-            else:
-                page = self.toString(uppercase)
-            f.write(page)
 
+# the tag classes of htmltags are made when they are first used through html
+if __name__ != '__main__':
+    sys.modules[__name__] = LazyModule(sys.modules[__name__], htmltags.__all__, lambda name: getattr(htmltags, name))
 
 
 if __name__ == '__main__':
     import webbrowser
+    from htmltags import *
 
     head = HEAD()
     head.add(META(NAME="description", CONTENT="Test page"))
@@ -0,0 +1,55 @@
+"""
+Rendering to asyncio streams without blocking the event loop.
+
+This module needs trollius, the asyncio of Python 2, and is only imported by
+TagBase.renderToStream and PAGE.renderToStream.
+"""
+import trollius as asyncio
+from trollius import From
+
+from htmltagbase import FLUSH
+
+
+# the renderers give the event loop a turn after writing this many bytes
+STREAM_CHUNK_SIZE = 16 * 1024
+
+
+@asyncio.coroutine
+def renderToStream(tag, writer, indentChar='', offset='', uppercase=True, chunkSize=STREAM_CHUNK_SIZE,
+                   encoding='utf-8'):
+    '''
+    Write the markup of a tag or a page to an asyncio stream. After every
+    chunkSize bytes and at each FLUSH it waits for writer.drain(), so that
+    a slow client holds the rendering back instead of filling the memory,
+    and lets the event loop run the other tasks. The unicode chunks of the
+    markup are encoded with encoding, the others are written as they are.
+
+    tag - [TagBase/PAGE] a tag or a page to render.
+    writer - [asyncio.StreamWriter] the stream to write to.
+    indentChar - [str] pretty print with this indent unless it is empty.
+    offset - [str] the indent of the tag when pretty printed.
+    uppercase - [bool] a flag to write tag and attribute names in uppercase.
+    chunkSize - [int] the number of bytes written between the turns of the
+                event loop.
+    encoding - [str] the encoding of unicode markup.
+    '''
+    if indentChar:
+        chunks = tag.iterPrettyRender(indentChar, offset, uppercase)
+    else:
+        chunks = tag.iterRender(uppercase)
+    size = 0
+    for chunk in chunks:
+        if chunk is FLUSH:
+            size = 0
+            yield From(writer.drain())
+            continue
+        if isinstance(chunk, unicode):
+            chunk = chunk.encode(encoding)
+        writer.write(chunk)
+        size += len(chunk)
+        if size >= chunkSize:
+            size = 0
+            yield From(writer.drain())
+            # drain returns at once while the buffer is low
+            yield From(asyncio.sleep(0))
+    yield From(writer.drain())
@@ -0,0 +1,333 @@
+"""
+Patches between two renders of a tree.
+
+diff compares an old tree with the tree built for the next render and
+returns the operations that turn the old one into the new one:
+
+    (TEXT, path, index, content)   replace the text content at index
+    (ATTRS, path, changes)         set the (name, value) pairs of changes on
+                                   the tag, a value of None removes the name
+                                   (the order of the attributes is not kept)
+    (INSERT, path, index, content) insert content at index
+    (REMOVE, path, index)          remove the content at index
+    (MOVE, path, fromIndex, toIndex)
+                                   take the content at fromIndex out and
+                                   insert it at toIndex
+
+path is the tuple of content indexes leading from the root to the tag whose
+contents or attributes change. The operations are applied in order, and the
+path of an operation is valid in the tree as patched by the operations
+before it. patch applies them to a tree.
+"""
+import copy
+
+from htmltagbase import TagBase
+
+
+TEXT = 'text'
+ATTRS = 'attrs'
+INSERT = 'insert'
+REMOVE = 'remove'
+MOVE = 'move'
+
+_MISSING = object()
+
+
+def _root(tree):
+    # a page is compared by its HTML tag
+    return tree if isinstance(tree, TagBase) else tree.html
+
+def _key(c):
+    # the ID of a tag, or None
+    if c.__class__ is str or not isinstance(c, TagBase) or not c.attrs:
+        return None
+    for name, val in c.attrs:
+        if name == 'ID':
+            return val
+    return None
+
+def _sameTag(a, b):
+    # Whether b can be made from a by patching its attributes and contents.
+    return (a.__class__ is b.__class__ and a.tagName == b.tagName and
+            a.stag == b.stag and a.etag == b.etag and a.emptyTag == b.emptyTag)
+
+def _sameKind(a, b):
+    # Whether a content of a is patched into a content of b: tags with
+    # different IDs are not.
+    if isinstance(a, TagBase):
+        return _sameTag(a, b) and (a.attrs == b.attrs or _key(a) == _key(b))
+    return not isinstance(b, TagBase)
+
+def _diffAttrs(a, b, path, patches):
+    if a.attrs == b.attrs:
+        return
+    old = dict(a.attrs or ())
+    new = dict(b.attrs or ())
+    if old == new:
+        return
+    changes = [(name, val) for name, val in b.attrs or () if old.get(name, _MISSING) != val]
+    changes.extend([(name, None) for name, _ in a.attrs or () if name not in new])
+    patches.append((ATTRS, path, changes))
+
+def _walk(tree, ids):
+    # add the ids of the tags of tree to ids
+    stack = [tree]
+    while stack:
+        tag = stack.pop()
+        ids.add(id(tag))
+        stack.extend([c for c in tag.contents if c.__class__ is not str and isinstance(c, TagBase)])
+
+def _diffContents(a, b, path, patches, pending, seen):
+    # Reorder a's contents like b's and queue the pairs of contents to compare.
+    # At both ends, a pair of different tags stops the scan when one of them
+    # is also among the other contents, so that it is matched with itself in
+    # the middle.
+    old = a.contents
+    new = b.contents
+    shared = None
+    start = 0
+    end = min(len(old), len(new))
+    while start < end:
+        x = old[start]
+        y = new[start]
+        if x is not y:
+            if x.__class__ is str and y.__class__ is str:
+                # most contents are text; the indexes before start do not
+                # change, so it is patched right away
+                if x != y:
+                    patches.append((TEXT, path, start, y))
+            elif not _sameKind(x, y):
+                break
+            else:
+                if shared is None:
+                    shared = set(map(id, old[start:])), set(map(id, new[start:]))
+                if id(y) in shared[0] or id(x) in shared[1]:
+                    break
+                pending.append((x, y, path, start))
+        start += 1
+    oldEnd = len(old)
+    newEnd = len(new)
+    if start == oldEnd == newEnd:
+        return
+    while oldEnd > start and newEnd > start:
+        x = old[oldEnd - 1]
+        y = new[newEnd - 1]
+        if x is not y:
+            if not _sameKind(x, y):
+                break
+            if shared is None:
+                shared = set(map(id, old[start:])), set(map(id, new[start:]))
+            if id(y) in shared[0] or id(x) in shared[1]:
+                break
+        oldEnd -= 1
+        newEnd -= 1
+    suffix = [(old[oldEnd + i], new[newEnd + i], newEnd + i) for i in range(len(old) - oldEnd)]
+
+    # the contents left in the middle are matched with the same tag first,
+    # then by ID, and the contents without an ID by position
+    same = {}
+    keyed = {}
+    for i in range(start, oldEnd):
+        c = old[i]
+        if isinstance(c, TagBase):
+            same.setdefault(id(c), []).append(i)
+            key = _key(c)
+            if key is not None:
+                keyed.setdefault(key, i)
+    sources = [None] * (newEnd - start)
+    used = set()
+    for i in range(start, newEnd):
+        positions = same.get(id(new[i]))
+        if positions:
+            j = positions.pop(0)
+            used.add(j)
+            sources[i - start] = j
+    for i in range(start, newEnd):
+        if sources[i - start] is not None:
+            continue
+        c = new[i]
+        key = _key(c)
+        j = keyed.get(key) if key is not None else i
+        if (j is not None and j < oldEnd and j not in used and
+                _key(old[j]) == key and _sameKind(old[j], c)):
+            used.add(j)
+            sources[i - start] = j
+
+    # contents without a match are removed, in reverse so that the indexes
+    # of the others hold
+    for j in range(oldEnd - 1, start - 1, -1):
+        if j not in used:
+            patches.append((REMOVE, path, j))
+    work = [j for j in range(start, oldEnd) if j in used]
+
+    # the longest run of matches already in order stays, the other matches
+    # are moved and the new contents inserted, each right after the content
+    # before it in b
+    stable = _increasing([j for j in sources if j is not None])
+    previous = None
+    for i, j in enumerate(sources):
+        if j is None:
+            token = -1 - i
+            index = work.index(previous) + 1 if previous is not None else 0
+            work.insert(index, token)
+            c = new[start + i]
+            if isinstance(c, TagBase):
+                _walk(c, seen)
+            patches.append((INSERT, path, start + index, c))
+        else:
+            token = j
+            if j not in stable:
+                if old[j] is new[start + i] and isinstance(old[j], TagBase):
+                    # the tags below a moved tag are looked for among the
+                    # patched ones
+                    _walk(old[j], seen)
+                current = work.index(j)
+                index = work.index(previous) + 1 if previous is not None else 0
+                if current < index:
+                    index -= 1
+                if current != index:
+                    del work[current]
+                    work.insert(index, j)
+                    patches.append((MOVE, path, start + current, start + index))
+        previous = token
+    for i, j in enumerate(sources):
+        if j is not None:
+            pending.append((old[j], new[start + i], path, start + i))
+    for a, b, i in suffix:
+        pending.append((a, b, path, i))
+
+def _increasing(seq):
+    # the set of the items of the longest increasing subsequence of seq
+    tails = []
+    links = {}
+    for x in seq:
+        lo, hi = 0, len(tails)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if tails[mid] < x:
+                lo = mid + 1
+            else:
+                hi = mid
+        links[x] = tails[lo - 1] if lo else None
+        if lo == len(tails):
+            tails.append(x)
+        else:
+            tails[lo] = x
+    result = set()
+    x = tails[-1] if tails else None
+    while x is not None:
+        result.add(x)
+        x = links[x]
+    return result
+
+def _diff(old, new, fixed):
+    # Return the operations and the ids of the tags of old that turned out
+    # to be patched in place although new reaches them too, or although
+    # they were compared at several places of old. The tags of fixed are
+    # replaced instead.
+    patches = []
+    pending = [(old, new, (), None)]
+    touched = set()
+    seen = set()
+    clashes = set()
+    while pending:
+        a, b, path, index = pending.pop()
+        if a is b:
+            seen.add(id(b))
+            continue
+        if not isinstance(a, TagBase):
+            if a.__class__ is not b.__class__ or a != b:
+                patches.append((TEXT, path, index, b))
+            continue
+        seen.add(id(b))
+        if a._fingerprint is not None and a._fingerprint == b._fingerprint:
+            continue
+        if id(a) in fixed:
+            if index is None:
+                raise ValueError('<%s> is part of the new tree' % a.tagName)
+            _walk(b, seen)
+            patches.append((REMOVE, path, index))
+            patches.append((INSERT, path, index, b))
+            continue
+        if id(a) in touched:
+            clashes.add(id(a))
+        touched.add(id(a))
+        if index is not None:
+            path = path + (index,)
+        _diffAttrs(a, b, path, patches)
+        mark = len(pending)
+        _diffContents(a, b, path, patches, pending, seen)
+        # compare the contents in document order
+        pending[mark:] = pending[mark:][::-1]
+    clashes.update(touched.intersection(seen))
+    return patches, clashes
+
+def diff(old, new):
+    '''
+    Return the list of operations that turn old into new (see the module
+    documentation).
+
+    The contents of two tags are compared from both ends, so that only the
+    contents between the first and the last change are matched: the same
+    tags first, then the ones with an ID by their ID, the others by
+    position. The subtrees that old and new share, or whose fingerprints
+    are known to be equal, are not compared at all, so a tree rebuilt from
+    the unchanged parts of the previous one is compared in time
+    proportional to what changed.
+
+    A compared tag of old that new reaches as well, or that is compared at
+    several places of old, is replaced rather than patched in place, and
+    the operations are worked out again. Sharing is only looked for among
+    the compared, inserted and moved tags: a tag of old that new reaches
+    through a subtree both trees share in place is not found.
+
+    old - [TagBase/PAGE] the tree of the previous render.
+    new - [TagBase/PAGE] the tree of the next render. The inserted and the
+          replaced contents in the operations are the contents of new;
+          patch inserts copies of them.
+    '''
+    old = _root(old)
+    new = _root(new)
+    if not _sameTag(old, new):
+        raise ValueError('<%s> cannot be patched into <%s>' % (old.tagName, new.tagName))
+    fixed = set()
+    while True:
+        patches, clashes = _diff(old, new, fixed)
+        if not clashes:
+            return patches
+        fixed.update(clashes)
+
+def patch(tree, patches):
+    '''
+    Apply the operations returned by diff to tree and return tree.
+
+    tree - [TagBase/PAGE] the old tree given to diff.
+    patches - [list of tuple] the operations.
+    '''
+    root = _root(tree)
+    for op in patches:
+        node = root
+        for i in op[1]:
+            node = node.contents[i]
+        kind = op[0]
+        if kind == TEXT:
+            node.setContent(op[2], op[3])
+            continue
+        if kind == ATTRS:
+            removed = set([name for name, val in op[2] if val is None])
+            if removed:
+                node.attrs = [(name, val) for name, val in node.attrs if name not in removed] or None
+            node.setAttr(**dict([(name, val) for name, val in op[2] if val is not None]))
+        elif kind == INSERT:
+            # a copy, so that the new tree is not shared with this one
+            content = copy.deepcopy(op[3]) if isinstance(op[3], TagBase) else op[3]
+            node.contents.insert(op[2], content)
+            node._adopt([content])
+        elif kind == REMOVE:
+            node._release([node.contents.pop(op[2])])
+        elif kind == MOVE:
+            node.contents.insert(op[3], node.contents.pop(op[2]))
+        else:
+            raise ValueError('unknown operation: %r' % (kind,))
+        node.invalidate()
+    return tree
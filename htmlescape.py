@@ -0,0 +1,87 @@
+"""
+Escaping of the text and the attribute values written into HTML.
+
+Character and entity references already in a string (ex. SP, COPY) are kept
+as they are, so that the constants of htmltagbase can be mixed with text.
+Markup and UnicodeMarkup strings are not escaped at all.
+"""
+import re
+
+
+class Markup(str):
+    '''
+    A string of markup that is written as it is, without escaping.
+
+    The markup rendered by the library (toString, toPrettyString) and the
+    contents added by addFromFile are Markup, so that adding them to a tag
+    does not escape them a second time.
+    '''
+
+    def __repr__(self):
+        return 'Markup(%s)' % str.__repr__(self)
+
+
+class UnicodeMarkup(unicode):
+    '''
+    A unicode string of markup that is written as it is, without escaping.
+    The markup rendered from unicode text is UnicodeMarkup.
+    '''
+
+    def __repr__(self):
+        return 'UnicodeMarkup(%s)' % unicode.__repr__(self)
+
+# the types of the strings written without escaping
+MARKUP_TYPES = (Markup, UnicodeMarkup)
+
+def markup(text):
+    '''
+    Return text as UnicodeMarkup when it is unicode, as Markup otherwise.
+
+    text - [basestring] markup to write as it is.
+    '''
+    if isinstance(text, unicode):
+        return UnicodeMarkup(text)
+    return Markup(text)
+
+
+# a reference to a character or an entity, which an ampersand may start
+_REF = r'(?:[A-Za-z][A-Za-z0-9]*|#[0-9]+|#[xX][0-9A-Fa-f]+);'
+
+# the characters to escape in text and in attribute values, matched in one
+# pass; an ampersand starting a reference is not matched
+_TEXT_SPECIALS = re.compile(r'&(?!%s)|<|>' % _REF)
+_ATTR_SPECIALS = re.compile(r'&(?!%s)|<|>|"' % _REF)
+
+_ENTITIES = {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;'}
+
+def _entity(match):
+    return _ENTITIES[match.group()]
+
+
+def escapeText(text):
+    '''
+    Return text with &, < and > escaped. text is returned as it is when it
+    has none of them.
+
+    text - [basestring] a text to write as the contents of a tag.
+    '''
+    if isinstance(text, MARKUP_TYPES):
+        return text
+    if '&' not in text and '<' not in text and '>' not in text:
+        return text
+    return _TEXT_SPECIALS.sub(_entity, text)
+
+def escapeAttr(value):
+    '''
+    Return value as a string with &, <, > and " escaped. value is returned as it
+    is when it is a string that has none of them.
+
+    value - [object] a value to write between the quotes of an attribute.
+    '''
+    if isinstance(value, MARKUP_TYPES):
+        return value
+    if not isinstance(value, basestring):
+        value = str(value)
+    if '&' not in value and '<' not in value and '>' not in value and '"' not in value:
+        return value
+    return _ATTR_SPECIALS.sub(_entity, value)
@@ -0,0 +1,204 @@
+"""
+Rendering and saving on several processes.
+"""
+import os
+import cPickle
+import traceback
+import multiprocessing
+
+from htmlescape import markup
+from htmltagbase import TagBase, _iterRender
+
+
+# subtrees of at least this many tags and strings are rendered by the pool
+PARALLEL_SIZE = 5000
+
+# the large subtrees are looked for inside the tags of at most this many
+# child tags (sections), down to this many levels
+_SECTIONS = 32
+_SECTION_DEPTH = 4
+
+# the subtrees or the pages a process of a pool started by this module
+# renders, set by _share
+_shared = []
+
+
+def _share(objects):
+    # The initializer of the pools started by this module. The pool keeps
+    # objects and gives them to every process it starts, also to the ones
+    # replacing processes that exited, which inherit them where processes
+    # are forked.
+    global _shared
+    _shared = objects
+
+
+def _renderShared(index, uppercase):
+    subtree = _shared[index]
+    # a process replacing one that exited is forked while the tree is
+    # rendered and inherits the stand-in memo of the subtree
+    subtree._cache = None
+    return ''.join(_iterRender(subtree, uppercase))
+
+def _renderPickled(data, uppercase):
+    return ''.join(_iterRender(cPickle.loads(data), uppercase))
+
+def _savePages(pages, indentChar, uppercase):
+    '''
+    Save (page, filePath) pairs and return (filePath, traceback) of the
+    pages that failed, whose files are left as they were.
+    '''
+    failures = []
+    for page, filePath in pages:
+        try:
+            page.save(filePath, indentChar, '', uppercase)
+        except Exception:
+            failures.append((filePath, traceback.format_exc()))
+    return failures
+
+def _saveShared(args):
+    start, stop, indentChar, uppercase = args
+    return _savePages(_shared[start:stop], indentChar, uppercase)
+
+def _savePickled(args):
+    data, indentChar, uppercase = args
+    return _savePages(cPickle.loads(data), indentChar, uppercase)
+
+class _Rendering(dict):
+    # Stands in for the memo of a subtree rendered by the pool. The serializer
+    # asks it for the markup when it reaches the subtree and waits for the
+    # worker only then.
+
+    def __init__(self, result):
+        dict.__init__(self)
+        self.result = result
+
+    def get(self, key, default=None):
+        return self.result.get()
+
+def _countContents(tag, limit):
+    '''
+    Return the number of tags and strings in the subtree of tag, counting no
+    further than limit.
+    '''
+    count = 1
+    stack = [tag]
+    while stack and count < limit:
+        contents = stack.pop().contents
+        count += len(contents)
+        stack.extend([c for c in contents if isinstance(c, TagBase)])
+    return count
+
+def _largeSubtrees(tag, threshold, depth=_SECTION_DEPTH):
+    '''
+    Return the subtrees below tag to render in other processes: the children
+    of at least threshold tags and strings, or the large subtrees inside
+    those of them that have at most _SECTIONS child tags, down to depth
+    levels. Children that already have a memo are skipped.
+    '''
+    subtrees = []
+    for c in tag.contents:
+        if isinstance(c, TagBase) and c._cache is None and _countContents(c, threshold) >= threshold:
+            inner = []
+            if depth and len([g for g in c.contents if isinstance(g, TagBase)]) <= _SECTIONS:
+                inner = _largeSubtrees(c, threshold, depth - 1)
+            subtrees.extend(inner or [c])
+    return subtrees
+
+def renderParallel(tag, uppercase=True, pool=None, threshold=PARALLEL_SIZE):
+    '''
+    Render tag like tag.toString(uppercase), with its large subtrees rendered
+    concurrently by processes. The result is identical to toString. The tree
+    must not be changed while it is rendered.
+
+    When pool is None, one process per subtree (at most one per CPU) is
+    forked for the call and inherits the tree. A given pool was started
+    before the tree was built, so the subtrees are pickled to it, which
+    costs about as much as rendering them; it only pays off for subtrees
+    that are slow to render (ex. with many foreign renderables).
+
+    tag - [TagBase/PAGE] a tag or a page to render.
+    uppercase - [bool] a flag to write tag and attribute names in uppercase.
+    pool - [multiprocessing.Pool] the pool to render with.
+    threshold - [int] the number of tags and strings from which a subtree is
+                rendered by another process.
+    '''
+    if not isinstance(tag, TagBase):
+        return markup(''.join([tag.doctype.toString(uppercase),
+                               renderParallel(tag.html, uppercase, pool, threshold)]))
+
+    subtrees = _largeSubtrees(tag, threshold)
+    if not subtrees:
+        return tag.toString(uppercase)
+
+    ownPool = pool is None
+    if ownPool and hasattr(os, 'fork'):
+        pool = multiprocessing.Pool(min(len(subtrees), multiprocessing.cpu_count()), _share, (subtrees,))
+        results = [pool.apply_async(_renderShared, (i, uppercase)) for i in range(len(subtrees))]
+    else:
+        if ownPool:
+            pool = multiprocessing.Pool()
+        results = [pool.apply_async(_renderPickled, (cPickle.dumps(subtree, 2), uppercase)) for subtree in subtrees]
+    try:
+        # the memo of each subtree is replaced while the tree is rendered
+        for subtree, result in zip(subtrees, results):
+            subtree._cache = _Rendering(result)
+        try:
+            return markup(''.join(_iterRender(tag, uppercase)))
+        finally:
+            for subtree in subtrees:
+                subtree._cache = None
+    finally:
+        if ownPool:
+            pool.close()
+            pool.join()
+
+def renderMany(pages, workers=None, chunkSize=None, indentChar='', uppercase=True, pool=None):
+    '''
+    Save many pages with a pool of processes, each page by the process that
+    renders it. Return a list of (filePath, traceback) of the pages that
+    failed, in the order of pages; the other pages are saved regardless.
+    The file of a page that failed is left as it was (see PAGE.save).
+
+    The pages are handed to the processes in chunks of chunkSize pages, so
+    that a process gets a batch of small pages at a time instead of one.
+    Where processes are forked, they inherit the pages. Elsewhere, or when
+    a pool is given, the chunks are pickled.
+
+    pages - [iterable of (PAGE, str)] pages and the paths to save them to.
+    workers - [int] the number of processes, one per CPU when it is None.
+              The pages are saved in this process when it is 1.
+    chunkSize - [int] the number of pages per chunk; by default the pages
+                are split in four chunks per process.
+    indentChar - [str] pretty print with this indent unless it is empty.
+    uppercase - [bool] a flag to write tag and attribute names in uppercase.
+    pool - [multiprocessing.Pool] the pool to save the pages with, which is
+           left running; workers only sets the size of the chunks then.
+    '''
+    pages = list(pages)
+    if workers is None:
+        workers = multiprocessing.cpu_count()
+    if pool is None and workers <= 1 or len(pages) <= 1:
+        return _savePages(pages, indentChar, uppercase)
+    if chunkSize is None:
+        chunkSize = max(1, -(-len(pages) // (workers * 4)))
+    chunks = [(i, min(i + chunkSize, len(pages))) for i in range(0, len(pages), chunkSize)]
+
+    ownPool = pool is None
+    if ownPool and hasattr(os, 'fork'):
+        pool = multiprocessing.Pool(min(workers, len(chunks)), _share, (pages,))
+        func = _saveShared
+        tasks = [(start, stop, indentChar, uppercase) for start, stop in chunks]
+    else:
+        if ownPool:
+            pool = multiprocessing.Pool(min(workers, len(chunks)))
+        func = _savePickled
+        tasks = [(cPickle.dumps(pages[start:stop], 2), indentChar, uppercase) for start, stop in chunks]
+    try:
+        failures = []
+        for chunkFailures in pool.imap(func, tasks):
+            failures.extend(chunkFailures)
+        return failures
+    finally:
+        if ownPool:
+            pool.close()
+            pool.join()
@@ -1,5 +1,17 @@
-from collections import deque
+import os
+import sys
+import mmap
+import stat
+import errno
+import shutil
+import types
+import hashlib
+import weakref
+import threading
+from collections import OrderedDict
+from itertools import chain
 from os.path import abspath, expanduser
+from htmlescape import Markup, UnicodeMarkup, markup, escapeText, escapeAttr
 
 
 SP    = '&nbsp;'  # non-breaking space
@@ -46,7 +58,375 @@ XHTML1_0_FRAMESET = 'html PUBLIC "-//W3C//DTD XHTML 1.0 Frameset//EN" "http://ww
 XHTML1_1 = 'html PUBLIC "-//W3C//DTD XHTML 1.1//EN" "http://www.w3.org/TR/xhtml11/DTD/xhtml11.dtd"'
 
 
-class TagBase:
+# default number of characters gathered before renderTo writes to its sink
+BUFFER_SIZE = 64 * 1024
+
+# files included by addFromFile of at least this many bytes are mapped into
+# memory instead of being read
+MMAP_SIZE = 256 * 1024
+
+# default number of characters of markup kept by the fragment cache
+FRAGMENT_CACHE_SIZE = 16 * 1024 * 1024
+
+
+def writeChunks(sink, chunks, bufferSize=BUFFER_SIZE):
+    '''
+    Write an iterable of string chunks to sink in writes of about bufferSize
+    characters.
+
+    sink - [file-like] any object with a write method.
+    chunks - [iterable of str/FileInclude] the data to write. A FileInclude is
+             copied by the kernel when sink is a file or a socket file, and
+             written as a whole otherwise. At FLUSH, what was gathered is
+             written and sink is flushed.
+    bufferSize - [int] the number of characters gathered before each write.
+    '''
+    write = sink.write
+    buf = []
+    size = 0
+    fd = None
+    for chunk in chunks:
+        if chunk is FLUSH:
+            if buf:
+                write(''.join(buf))
+                del buf[:]
+                size = 0
+            if hasattr(sink, 'flush'):
+                sink.flush()
+            continue
+        if chunk.__class__ is FileInclude:
+            if buf:
+                write(''.join(buf))
+                del buf[:]
+                size = 0
+            if fd is None:
+                fd = _sinkFd(sink)
+            if fd < 0:
+                write(chunk.read())
+            elif not _splice(sink, fd, chunk.path):
+                write(chunk.map())
+            continue
+        buf.append(chunk)
+        size += len(chunk)
+        if size >= bufferSize:
+            write(''.join(buf))
+            del buf[:]
+            size = 0
+    if buf:
+        write(''.join(buf))
+
+def saveFile(filePath, write):
+    '''
+    Call write with a file to write the contents of filePath to, and only
+    make them the contents of filePath once write returns: filePath is left
+    as it was when write fails. The contents are written to a temporary file
+    next to filePath, which then replaces it, or is copied into it when
+    filePath has other hard links. A symbolic link is followed, and the
+    replaced file keeps its mode and, when the process may set it, its
+    owner.
+
+    filePath - [str] the path of the file to write. The missing directories
+               are made.
+    write - [callable] a function taking the file object to write to.
+    '''
+    filePath = os.path.realpath(filePath)
+    dir, name = os.path.split(filePath)
+    if not os.path.exists(dir):
+        os.makedirs(dir)
+    try:
+        st = os.stat(filePath)
+    except OSError as e:
+        if e.errno != errno.ENOENT:
+            raise
+        st = None
+    # a new file gets the mode open gives it
+    while True:
+        tmpPath = os.path.join(dir, '.%s.%s.tmp' % (name, os.urandom(6).encode('hex')))
+        try:
+            fd = os.open(tmpPath, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0666)
+            break
+        except OSError as e:
+            if e.errno != errno.EEXIST:
+                raise
+    try:
+        with os.fdopen(fd, 'w') as f:
+            write(f)
+        if st is not None and st.st_nlink > 1:
+            shutil.copyfile(tmpPath, filePath)
+            os.remove(tmpPath)
+            return
+        if st is not None:
+            os.chmod(tmpPath, stat.S_IMODE(st.st_mode))
+            if hasattr(os, 'chown'):
+                try:
+                    os.chown(tmpPath, st.st_uid, st.st_gid)
+                except OSError:
+                    pass
+            if os.name == 'nt':
+                os.remove(filePath)
+        os.rename(tmpPath, filePath)
+    except:
+        if os.path.exists(tmpPath):
+            os.remove(tmpPath)
+        raise
+
+def _sinkFd(sink):
+    # the file descriptor of sink when it is a file or a socket file, or -1.
+    # Other file-likes may have a file descriptor below a layer (ex. gzip)
+    # that must not be written directly.
+    socket = sys.modules.get('socket')
+    if isinstance(sink, file) or socket is not None and isinstance(sink, socket._fileobject):
+        return sink.fileno()
+    return -1
+
+_sendfile = []
+
+def _getSendfile():
+    # os.sendfile of python 3.3 and later, or sendfile of the C library
+    # through ctypes, or None. ctypes is only imported when it is needed.
+    if not _sendfile:
+        func = getattr(os, 'sendfile', None)
+        if func is None:
+            try:
+                import ctypes, ctypes.util
+                libc = ctypes.CDLL(ctypes.util.find_library('c'), use_errno=True)
+                csendfile = libc.sendfile64
+            except (ImportError, OSError, AttributeError):
+                csendfile = None
+            if csendfile is not None:
+                csendfile.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.POINTER(ctypes.c_int64), ctypes.c_size_t]
+                csendfile.restype = ctypes.c_ssize_t
+                def func(outFd, inFd, offset, count):
+                    pos = ctypes.c_int64(offset)
+                    sent = csendfile(outFd, inFd, ctypes.byref(pos), count)
+                    if sent < 0:
+                        err = ctypes.get_errno()
+                        raise OSError(err, os.strerror(err))
+                    return sent
+        _sendfile.append(func)
+    return _sendfile[0]
+
+def _splice(sink, fd, path):
+    '''
+    Copy the file at path to the file descriptor fd of sink in the kernel.
+    Return False without writing anything when the system cannot do it.
+    '''
+    sendfile = _getSendfile()
+    if sendfile is None:
+        return False
+    sink.flush()
+    with open(path, 'rb') as f:
+        size = os.fstat(f.fileno()).st_size
+        offset = 0
+        while offset < size:
+            try:
+                sent = sendfile(fd, f.fileno(), offset, size - offset)
+            except OSError as e:
+                if offset == 0 and e.errno in (errno.EINVAL, errno.ENOSYS, errno.EOPNOTSUPP):
+                    return False
+                raise
+            if not sent:
+                break
+            offset += sent
+    return True
+
+
+class _FlushPoint(str):
+    # the type of FLUSH
+
+    def __reduce__(self):
+        return 'FLUSH'
+
+# A flush point to put in the contents of a tag. It is written as nothing,
+# but the streaming renderers yield what they have gathered when they reach
+# it, and renderTo flushes its sink.
+FLUSH = _FlushPoint()
+
+class _Flushed(str):
+    # The memo of a subtree with flush points in it: its markup, which is
+    # what toString needs, and the segments between the flush points, which
+    # the streaming renderers yield with FLUSH between them.
+    pass
+
+class _UnicodeFlushed(unicode):
+    # _Flushed of unicode markup
+    pass
+
+_FLUSHED = (_Flushed, _UnicodeFlushed)
+
+def _joinChunks(chunks):
+    # join the chunks of a renderer into the markup of a memo
+    segments = []
+    pieces = []
+    for chunk in chunks:
+        if chunk is FLUSH:
+            segments.append(''.join(pieces))
+            del pieces[:]
+        else:
+            pieces.append(chunk)
+    data = ''.join(pieces)
+    if not segments:
+        return data
+    segments.append(data)
+    data = ''.join(segments)
+    flushed = _UnicodeFlushed(data) if isinstance(data, unicode) else _Flushed(data)
+    flushed.segments = segments
+    return flushed
+
+
+# path: (mtime, size, contents) of the files included by addFromFile
+_includes = {}
+
+
+class FragmentCache(object):
+    '''
+    Rendered markup of subtrees shared by all the trees of the process,
+    keyed by the fingerprint of a subtree and the way it is rendered, so
+    that equal subtrees of different trees are rendered once. The least
+    recently used fragments are evicted when they hold more than maxSize
+    characters. The tags memoized by setCache(shared=True) go through
+    fragments, the cache of the process.
+    '''
+
+    def __init__(self, maxSize=FRAGMENT_CACHE_SIZE):
+        '''
+        maxSize - [int] the number of characters kept at most.
+        '''
+        self.maxSize = maxSize
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._fragments = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._fragments)
+
+    def get(self, key):
+        '''
+        Return the fragment of key and mark it as the most recently used, or
+        None when it is not cached.
+        '''
+        with self._lock:
+            data = self._fragments.pop(key, None)
+            if data is None:
+                self.misses += 1
+                return None
+            self._fragments[key] = data
+            self.hits += 1
+            return data
+
+    def put(self, key, data):
+        '''
+        Cache the fragment of key, evicting the least recently used ones
+        beyond maxSize. A fragment larger than maxSize is not cached.
+        '''
+        if len(data) > self.maxSize:
+            return
+        with self._lock:
+            old = self._fragments.pop(key, None)
+            if old is not None:
+                self.size -= len(old)
+            self._fragments[key] = data
+            self.size += len(data)
+            while self.size > self.maxSize:
+                _, evicted = self._fragments.popitem(last=False)
+                self.size -= len(evicted)
+                self.evictions += 1
+
+    def clear(self):
+        '''
+        Drop the fragments and reset the counters.
+        '''
+        with self._lock:
+            self._fragments.clear()
+            self.size = self.hits = self.misses = self.evictions = 0
+
+    def stats(self):
+        '''
+        Return a dict of the counters: hits, misses, evictions, the number
+        of fragments and their size in characters.
+        '''
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                'fragments': len(self._fragments), 'size': self.size}
+
+fragments = FragmentCache()
+
+
+class _SharedMemo(dict):
+    # The memo of a tag whose markup is looked for in fragments before it is
+    # rendered.
+    pass
+
+def _memoize(tag, key, render):
+    # Fill the memo of tag for key with render(), or with the fragment of an
+    # equal subtree rendered before when the memo is shared.
+    if tag._cache.__class__ is not _SharedMemo:
+        data = render()
+    else:
+        shared = (tag.fingerprint(), key)
+        data = fragments.get(shared)
+        if data is None:
+            data = render()
+            fragments.put(shared, data)
+    tag._cache[key] = data
+    return data
+
+class FileInclude(object):
+    '''
+    A file included in the contents of a tag by addFromFile. The file is
+    read when the tag is rendered, through a cache shared by the whole
+    process that is refreshed when the modification time or the size of the
+    file changes.
+    '''
+    __slots__ = ('path',)
+
+    def __init__(self, path):
+        '''
+        path - [str] an absolute path of the file.
+        '''
+        self.path = path
+
+    def __repr__(self):
+        return 'FileInclude(%r)' % self.path
+
+    def map(self):
+        '''
+        Return the contents of the file as Markup, or as a read only mmap when
+        the file has at least MMAP_SIZE bytes.
+        '''
+        st = os.stat(self.path)
+        entry = _includes.get(self.path)
+        if entry is not None and entry[0] == st.st_mtime and entry[1] == st.st_size:
+            return entry[2]
+        with open(self.path, 'r') as f:
+            if st.st_size >= MMAP_SIZE:
+                data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            else:
+                data = Markup(f.read())
+        _includes[self.path] = (st.st_mtime, st.st_size, data)
+        return data
+
+    def read(self):
+        '''
+        Return the contents of the file as Markup.
+        '''
+        data = self.map()
+        return data if data.__class__ is Markup else Markup(data[:])
+
+
+class TagBase(object):
+
+    # Subclasses declare empty __slots__ as well, so that a tag carries no
+    # __dict__. Attribute values set by setAttr are kept in attrs, a list of
+    # (name, value) pairs in the order they were first set.
+    __slots__ = ('tagName', 'contents', 'stag', 'etag', 'emptyTag', 'attrs', '_cache', '_fingerprint', '_parents', '__weakref__')
+
+    # names of the attributes the tag accepts, shared by all its instances
+    attrset = frozenset()
+    # the attribute groups attrset was made from
+    attrgroups = ()
 
     def __init__(self, tagName, *contents, **kargs):
         '''
@@ -62,12 +442,39 @@ class TagBase:
         self.stag = kargs.get('stag', None)
         self.etag = kargs.get('etag', None)
         self.emptyTag = kargs.get('emptyTag', False)
-        self.attrset = frozenset()
-        self.attrlist = deque()
+        self.attrs = None
+        self._cache = None
+        self._fingerprint = None
+        self._parents = None
 
     def __str__(self):
         return self.toString()
 
+    def __getattr__(self, name):
+        if name in self.attrset and self.attrs:
+            for attr, val in self.attrs:
+                if attr == name:
+                    return val
+        raise AttributeError("'%s' object has no attribute '%s'" % (type(self).__name__, name))
+
+    def __getstate__(self):
+        # the memo, the fingerprint and the links to the parents stay with
+        # the original tree
+        return (self.tagName, self.contents, self.stag, self.etag, self.emptyTag, self.attrs)
+
+    def __setstate__(self, state):
+        self.tagName, self.contents, self.stag, self.etag, self.emptyTag, self.attrs = state
+        self._cache = None
+        self._fingerprint = None
+        self._parents = None
+
+    @property
+    def attrlist(self):
+        '''
+        names of the attributes set on the tag in the order they were set
+        '''
+        return [attr for attr, _ in self.attrs] if self.attrs else []
+
     def add(self, *contents):
         '''
         Add *contents to the tag contents.
@@ -75,11 +482,18 @@ class TagBase:
         *contents - [str/Tag] a content surrounded by <tag>...</tag>.
         '''
         self.contents.extend(list(contents))
+        if self._cache is not None or self._parents or self._fingerprint is not None:
+            self._adopt(contents)
+            self.invalidate()
         return self
 
     def addFromFile(self, path):
-        with open(abspath(expanduser(path)), 'r') as f:
-            self.contents.append(f.read())
+        '''
+        Add the contents of the file at path without escaping them. The file
+        is read when the tag is rendered, see FileInclude.
+        '''
+        self.contents.append(FileInclude(abspath(expanduser(path))))
+        self.invalidate()
         return self
 
     def set(self, *contents):
@@ -88,7 +502,25 @@ class TagBase:
 
         *contents - [str/Tag] a content surrounded by <tag>...</tag>.
         '''
+        old = self.contents
         self.contents = list(contents)
+        self._release(old)
+        self._adopt(contents)
+        self.invalidate()
+        return self
+
+    def setContent(self, index, content):
+        '''
+        Replace the content at index of the tag contents with content.
+
+        index - [int] an index of the tag contents.
+        content - [str/Tag] a content surrounded by <tag>...</tag>.
+        '''
+        old = self.contents[index]
+        self.contents[index] = content
+        self._release([old])
+        self._adopt([content])
+        self.invalidate()
         return self
 
     def setAttr(self, **attrs):
@@ -96,60 +528,703 @@ class TagBase:
         **attrs - [dict] tag attributes (ex. class, name, src, xmlLang, etc)
         '''
         for attr, val in attrs.items():
-            if attr in self.attrset:
-                setattr(self, attr, val)
-                self.attrlist.append(attr)
-            else:
+            if attr not in self.attrset:
                 raise TypeError('<%s> does not have "%s" attribute' % (self.tagName, attr))
+            if self.attrs is None:
+                self.attrs = [(attr, val)]
+                continue
+            for i, (name, _) in enumerate(self.attrs):
+                if name == attr:
+                    self.attrs[i] = (attr, val)
+                    break
+            else:
+                self.attrs.append((attr, val))
+        if self._cache is not None or self._parents or self._fingerprint is not None:
+            self.invalidate()
         return self
 
+    def setCache(self, enable=True, shared=False):
+        '''
+        Enable or disable memoization of the rendered markup of this tag.
+
+        The memo is kept per case and indentation and is discarded when this
+        tag or any descendant is changed by add, addFromFile, set, setContent
+        or setAttr. Call invalidate() after changing contents or attributes
+        in any other way.
+
+        enable - [bool] a flag to memoize the rendered markup.
+        shared - [bool] a flag to look for the markup in fragments, the cache
+                 of the process keyed by fingerprint, before rendering it, so
+                 that equal subtrees of other trees are rendered once.
+        '''
+        if not enable:
+            self._cache = None
+        elif self._cache is None:
+            self._cache = _SharedMemo() if shared else {}
+            self._watch()
+        elif shared != (self._cache.__class__ is _SharedMemo):
+            self._cache = _SharedMemo(self._cache) if shared else dict(self._cache)
+        return self
+
+    def invalidate(self):
+        '''
+        Discard the memoized markup and the fingerprint of this tag and of all
+        its ancestors.
+        '''
+        if self._cache is None and not self._parents and self._fingerprint is None:
+            return
+        stack = [self]
+        seen = set()
+        while stack:
+            node = stack.pop()
+            if id(node) in seen:
+                continue
+            seen.add(id(node))
+            if node._cache:
+                node._cache.clear()
+            node._fingerprint = None
+            if node._parents:
+                stack.extend([p for p in [ref() for ref in node._parents] if p is not None])
+
+    def _isWatched(self):
+        # A watched tag has a memo or a fingerprint, or an ancestor with one,
+        # and knows its parents so that changes can be propagated upwards.
+        return self._cache is not None or bool(self._parents) or self._fingerprint is not None
+
+    def fingerprint(self):
+        '''
+        Return a hex digest of the structure of this tag: its tag name, its
+        attributes and its contents, tags by their own fingerprint. Two tags
+        render the same markup if they have the same fingerprint.
+
+        The fingerprint is kept until this tag or a descendant is changed by
+        add, addFromFile, set, setContent or setAttr, so only the changed
+        tags and their ancestors are hashed again. Like the memo of setCache,
+        call invalidate() after changing a tag in any other way. The tags
+        with a file added by addFromFile below them keep no fingerprint, so
+        that the modification time and size of the file are checked on
+        every call.
+        '''
+        if self._fingerprint is not None:
+            return self._fingerprint
+        if not self._isWatched():
+            self._watch()
+        return _fingerprint(self)
+
+    def _watch(self):
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            for c in node.contents:
+                if isinstance(c, TagBase):
+                    watched = c._isWatched()
+                    c._addParent(node)
+                    if not watched:
+                        stack.append(c)
+
+    def _addParent(self, parent):
+        if self._parents is None:
+            self._parents = []
+        elif any([ref() is parent for ref in self._parents]):
+            return
+        self._parents.append(weakref.ref(parent))
+
+    def _adopt(self, contents):
+        if self._isWatched():
+            for c in contents:
+                if isinstance(c, TagBase):
+                    watched = c._isWatched()
+                    c._addParent(self)
+                    if not watched:
+                        c._watch()
+
+    def _release(self, contents):
+        # called once contents are out of self.contents; a content still at
+        # another index keeps its link to this tag
+        for c in contents:
+            if isinstance(c, TagBase) and c._parents and not any([x is c for x in self.contents]):
+                c._parents = [ref for ref in c._parents if ref() is not None and ref() is not self]
+
+    def _attrString(self, uppercase):
+        if not self.attrs:
+            return ''
+        form = 0 if uppercase else 1
+        names = _attrNames
+        return ''.join([' %s="%s"' % ((names.get(a) or _addAttrName(a))[form], escapeAttr(v)) for a, v in self.attrs])
+
+    def _emptyTagString(self, uppercase):
+        return ''.join([self.stag if self.stag is not None else '<%s' % (self.tagName if uppercase else self.tagName.lower()),
+                        self._attrString(uppercase),
+                        self.etag if self.etag is not None else ' />'])
+
+    def _startTagString(self, uppercase):
+        if self.stag is not None:
+            return self.stag
+        return '<%s%s>' % (self.tagName if uppercase else self.tagName.lower(), self._attrString(uppercase))
+
+    def _endTagString(self, uppercase):
+        if self.etag is not None:
+            return self.etag
+        return '</%s>' % (self.tagName if uppercase else self.tagName.lower())
+
+    def iterRender(self, uppercase=True, mapped=False, flushAfter=None):
+        '''
+        Yield the markup of this tag chunk by chunk in document order.
+
+        The joined chunks are identical to toString(uppercase). The tree is
+        walked with an explicit stack, so memory is bounded by the depth of
+        the tree instead of the size of the document. Everything before a
+        FLUSH in the contents is yielded before it, followed by FLUSH.
+
+        mapped - [bool] yield the files included by addFromFile that are
+                 mapped into memory as their FileInclude instead of a str
+                 copy (see writeChunks).
+        flushAfter - [object] a content of this tag to yield FLUSH after, as
+                     if it were followed by one (ex. the HEAD of an HTML).
+                     The memo of this tag is not used then, but the memos
+                     of its contents are.
+        '''
+        if flushAfter is None or self.emptyTag:
+            return _iterRender(self, uppercase, mapped=mapped)
+        return _iterRenderFlushing(self, uppercase, mapped, flushAfter)
+
     def toString(self, uppercase=True):
-        if uppercase:
-            attrs = ' '.join(['%s="%s"' % (a.replace('__',':').replace('_','-'), getattr(self, a)) for a in self.attrlist])
-            tagName = self.tagName
-        else:
-            attrs = ' '.join(['%s="%s"' % (a.replace('__',':').replace('_','-').lower(), getattr(self, a)) for a in self.attrlist])
-            tagName = self.tagName.lower()
+        return markup(''.join(_iterRender(self, uppercase)))
 
-        if attrs:
-            attrs = ''.join([' ', attrs])
+    def _prettyEmptyTagLine(self, offset, uppercase):
+        return '%s<%s%s />' % (offset, self.tagName if uppercase else self.tagName.lower(), self._attrString(uppercase))
 
-        if self.emptyTag:
-            data = '%s%s%s' % (self.stag if self.stag is not None else '<%s' % (tagName),
-                               attrs,
-                               self.etag if self.etag is not None else ' />')
-        else:
-            contents = [c.replace('<',LT).replace('>',GT) if not hasattr(c,'toString') else c.toString(uppercase) for c in self.contents if c]
-            contents = ''.join(contents)
+    def _prettyStartTagLine(self, offset, uppercase):
+        if self.stag is not None:
+            return '%s%s' % (offset, self.stag)
+        return '%s<%s%s>' % (offset, self.tagName if uppercase else self.tagName.lower(), self._attrString(uppercase))
 
-            data = [self.stag if self.stag is not None else '<%s%s>' % (tagName, attrs),
-                    contents,
-                    self.etag if self.etag is not None else '</%s>' % tagName]
-            data = ''.join([d for d in data if d])
+    def _prettyEndTagLine(self, offset, uppercase):
+        if self.stag is not None:
+            return '%s%s' % (offset, self.etag)
+        return '%s</%s>' % (offset, self.tagName if uppercase else self.tagName.lower())
 
-        return data
+    def iterPrettyRender(self, indentChar='    ', offset='', uppercase=True, flushAfter=None):
+        '''
+        Yield the indented markup of this tag chunk by chunk in document order.
+        The joined chunks are identical to toPrettyString(). Like iterRender,
+        everything before a FLUSH in the contents is yielded before it.
+
+        flushAfter - [object] a content of this tag to yield FLUSH after (see
+                     iterRender).
+        '''
+        if flushAfter is None:
+            return _iterPrettyRender(self, indentChar, offset, uppercase)
+        return _iterPrettyRender(self, indentChar, offset, uppercase, self, flushAfter)
 
     def toPrettyString(self, indentChar='    ', offset='', uppercase=True):
-        if uppercase:
-            attrs = ' '.join(['%s="%s"' % (a.replace('__',':').replace('_','-'), getattr(self, a)) for a in self.attrlist])
-            tagName = self.tagName
+        return markup(''.join(_iterPrettyRender(self, indentChar, offset, uppercase)))
+
+    def renderToStream(self, writer, indentChar='', offset='', uppercase=True, chunkSize=None,
+                       encoding='utf-8'):
+        '''
+        Return a coroutine writing the markup of this tag to an asyncio stream
+        writer without blocking the event loop. See htmlasync.renderToStream;
+        it needs trollius.
+        '''
+        import htmlasync
+        if chunkSize is None:
+            chunkSize = htmlasync.STREAM_CHUNK_SIZE
+        return htmlasync.renderToStream(self, writer, indentChar, offset, uppercase, chunkSize, encoding)
+
+    def compile(self, indentChar='', offset='', uppercase=True):
+        '''
+        Return a Template of this tag with its slots left to be filled when
+        it is rendered. See htmltemplate.compile.
+        '''
+        import htmltemplate
+        return htmltemplate.compile(self, indentChar, offset, uppercase)
+
+    def renderTo(self, sink, indentChar='', offset='', uppercase=True, bufferSize=BUFFER_SIZE):
+        '''
+        Write the markup of this tag to sink without building it as a whole.
+
+        sink - [file-like] any object with a write method.
+        indentChar - [str] pretty print with this indent unless it is empty.
+        offset - [str] the indent of this tag when pretty printed.
+        uppercase - [bool] a flag to write tag and attribute names in uppercase.
+        bufferSize - [int] the number of characters gathered before each write.
+        '''
+        if indentChar:
+            chunks = _iterPrettyRender(self, indentChar, offset, uppercase)
+        else:
+            chunks = _iterRender(self, uppercase, mapped=True)
+        writeChunks(sink, chunks, bufferSize)
+
+
+def dedupe(tree):
+    '''
+    Make the identical subtrees of tree one shared instance and return tree.
+
+    Tags with the same class, attributes and contents are replaced by the
+    first of them, equal text strings by one string, so a catalog repeating
+    the same icons, empty cells or BR tags keeps one of each. The tags with
+    an ID and the root are never replaced, nor are the tags whose contents
+    are neither text nor tags (ex. addFromFile). The shared instances
+    memoize their markup (see setCache), so that each is rendered once.
+
+    A shared tag appears at several places: change it and it changes at
+    all of them. Replace a shared tag with set or setContent instead of
+    changing it.
+
+    tree - [TagBase/PAGE] a tree or a page.
+    '''
+    root = tree if isinstance(tree, TagBase) else tree.html
+    texts = {}
+    tags = {}
+    uses = {}
+    # id of a tag walked: (the tag, the tag replacing it)
+    canonical = {}
+    stack = [root]
+    while stack:
+        tag = stack[-1]
+        if id(tag) in canonical:
+            stack.pop()
+            continue
+        pending = [c for c in tag.contents if isinstance(c, TagBase) and id(c) not in canonical]
+        if pending:
+            stack.extend(pending)
+            continue
+        stack.pop()
+        contents = tag.contents
+        key = []
+        for i, c in enumerate(contents):
+            if c.__class__ is str:
+                c = contents[i] = texts.setdefault(c, c)
+                if key is not None:
+                    key.append(c)
+            elif isinstance(c, TagBase):
+                shared = canonical[id(c)][1]
+                if shared is not c:
+                    contents[i] = shared
+                    if tag._isWatched():
+                        tag._release([c])
+                        tag._adopt([shared])
+                if key is not None:
+                    key.append(id(shared))
+            elif c.__class__ is Markup and key is not None:
+                key.append((c,))
+            else:
+                key = None
+        if tag is root or key is None or any([name == 'ID' for name, _ in tag.attrs or ()]):
+            canonical[id(tag)] = (tag, tag)
+            continue
+        key = (tag.__class__, tag.tagName, tag.stag, tag.etag, tag.emptyTag,
+               tuple(tag.attrs) if tag.attrs else None, tuple(key))
+        try:
+            shared = tags.setdefault(key, tag)
+        except TypeError:
+            # an attribute value that cannot be hashed
+            canonical[id(tag)] = (tag, tag)
+            continue
+        canonical[id(tag)] = (tag, shared)
+        uses[id(shared)] = uses.get(id(shared), 0) + 1
+    for tag in tags.itervalues():
+        if uses[id(tag)] > 1 and tag._cache is None:
+            tag.setCache()
+    return tree
+
+
+class TagType(type):
+    # The type of the classes made by makeTagClass. Their documentation is
+    # kept in a separate module and imported on the first access of __doc__,
+    # so that importing the classes does not load it.
+
+    @property
+    def __doc__(cls):
+        doc = cls.__dict__.get('__doc__')
+        if doc is None and cls.__dict__.get('_docs') is not None:
+            module, name = cls.__dict__['_docs']
+            doc = __import__(module).DOCS.get(name)
+        return doc
+
+
+# attribute name: (name written in uppercase, name written in lowercase)
+_attrNames = {}
+
+def _addAttrName(name):
+    form = name.replace('__',':').replace('_','-')
+    forms = _attrNames[name] = (form, form.lower())
+    return forms
+
+_attrGroups = {}
+
+def attrGroup(names):
+    '''
+    Return the frozenset of the interned names. Equal groups are returned as
+    the same object, so that tags accepting the same attributes share it.
+
+    names - [iterable of str] names of attributes.
+    '''
+    group = frozenset([intern(name) for name in names])
+    for name in group:
+        if name not in _attrNames:
+            _addAttrName(name)
+    return _attrGroups.setdefault(group, group)
+
+def makeTagClass(tagName, emptyTag, attrset, module, docs=None, groups=()):
+    '''
+    Make a TagBase subclass for a tag.
+
+    tagName - [str] a tag name.
+    emptyTag - [bool] a flag to indicate an empty tag or not.
+    attrset - [iterable of str] names of the attributes only this tag accepts.
+    module - [str] the name of the module the class belongs to.
+    docs - [str] the name of a module whose DOCS dict maps tagName to the
+           documentation of the class.
+    groups - [tuple of frozenset] attribute groups made by attrGroup that the
+             tag accepts as well.
+    '''
+    if emptyTag:
+        def __init__(self, **attrs):
+            TagBase.__init__(self, tagName, emptyTag=True)
+            if attrs:
+                self.setAttr(**attrs)
+    else:
+        def __init__(self, *contents, **attrs):
+            TagBase.__init__(self, tagName, *contents, emptyTag=False)
+            if attrs:
+                self.setAttr(**attrs)
+
+    return TagType(tagName, (TagBase,), {
+            '__slots__' : (),
+            '__module__': module,
+            '__init__'  : __init__,
+            '_docs'     : (docs, tagName) if docs else None,
+            'attrset'   : attrGroup(chain(attrset, *groups)),
+            'attrgroups': groups,
+            })
+
+
+class LazyModule(types.ModuleType):
+    '''
+    A module that makes the values of a set of names on first access.
+    Install it in place of the module being imported:
+
+        sys.modules[__name__] = LazyModule(sys.modules[__name__], names, factory)
+    '''
+
+    def __init__(self, module, names, factory):
+        '''
+        module - [module] the module to take the other attributes from.
+        names - [container of str] names of the attributes made on demand.
+        factory - [callable] makes the value of a name.
+        '''
+        types.ModuleType.__init__(self, module.__name__)
+        self.__dict__.update(module.__dict__)
+        self.__all__ = sorted(set([name for name, val in module.__dict__.items()
+                                   if not name.startswith('_') and not isinstance(val, types.ModuleType)] +
+                                  list(names)))
+        # the functions of the module keep using its globals, which python 2
+        # clears when the module object is freed
+        self._module = module
+        self._names = names
+        self._factory = factory
+
+    def __getattr__(self, name):
+        if name.startswith('_') or name not in self._names:
+            raise AttributeError("'module' object has no attribute '%s'" % name)
+        val = self._factory(name)
+        setattr(self, name, val)
+        return val
+
+
+def _hashed(kind, text):
+    # text prefixed with its kind and its length; unicode is hashed as UTF-8
+    # under a kind of its own
+    if isinstance(text, unicode):
+        text = text.encode('utf-8')
+        kind = 'u' + kind
+    elif not isinstance(text, str):
+        text = str(text)
+    return '%s%d:%s' % (kind, len(text), text)
+
+def _fingerprintHead(tag):
+    # the part of the hashed data that comes from the tag itself
+    head = tag.tagName + ('\1' if tag.emptyTag else '\0')
+    if tag.stag is not None or tag.etag is not None:
+        head += '%r\0%r\0' % (tag.stag, tag.etag)
+    if tag.attrs:
+        head += ''.join([_hashed('a%s=' % name, val) for name, val in tag.attrs])
+    return head
+
+def _fingerprint(root):
+    # Hash the tags of the tree that have no fingerprint, children first,
+    # walking it like _iterRender, and return the fingerprint of root. Text
+    # is prefixed with its length so that contents cannot run into each
+    # other. The tags above a file include are not given their fingerprint,
+    # which depends on the file.
+    sha1 = hashlib.sha1
+    stack = []
+    tag = root
+    included = False
+    parts = [_fingerprintHead(root)]
+    contents = iter(root.contents)
+    while True:
+        for c in contents:
+            if c.__class__ is str:
+                if c:
+                    parts.append('s%d:%s' % (len(c), c))
+            elif c.__class__ is Markup:
+                parts.append('m%d:%s' % (len(c), c))
+            elif isinstance(c, TagBase):
+                if c._fingerprint is not None:
+                    parts.append('t' + c._fingerprint)
+                    continue
+                stack.append((tag, parts, contents, included))
+                tag = c
+                included = False
+                if c.stag is None and c.etag is None and not c.attrs:
+                    parts = [c.tagName + ('\1' if c.emptyTag else '\0')]
+                else:
+                    parts = [_fingerprintHead(c)]
+                contents = iter(c.contents)
+                break
+            elif c.__class__ is FileInclude:
+                st = os.stat(c.path)
+                parts.append('%s\0%r\0%d' % (_hashed('f', c.path), st.st_mtime, st.st_size))
+                included = True
+            elif not c:
+                continue
+            elif hasattr(c, 'toString'):
+                parts.append(_hashed('m', c.toString(True)))
+            elif c.__class__ is UnicodeMarkup:
+                parts.append(_hashed('m', c))
+            else:
+                parts.append(_hashed('s', c))
         else:
-            attrs = ' '.join(['%s="%s"' % (a.replace('__',':').replace('_','-').lower(), getattr(self, a)) for a in self.attrlist])
-            tagName = self.tagName.lower()
+            fingerprint = sha1(''.join(parts)).hexdigest()
+            if not included:
+                tag._fingerprint = fingerprint
+            if not stack:
+                return fingerprint
+            tag, parts, contents, above = stack.pop()
+            included = included or above
+            parts.append('t' + fingerprint)
 
-        if attrs:
-            attrs = ''.join([' ', attrs])
+# number of pieces gathered before the renderers yield them as one chunk
+_CHUNK_PIECES = 512
 
-        if self.emptyTag:
-            data = '%s<%s%s />' % (offset, tagName, attrs)
+def _iterRender(root, uppercase, filling=None, mapped=False):
+    # filling is the tag whose memo is being filled by this call, and mapped
+    # makes large file includes yielded as their FileInclude
+    pieces = []
+    append = pieces.append
+    stack = []
+    contents = iter([root])
+    etag = None
+    while True:
+        for c in contents:
+            if c.__class__ is str:
+                if c:
+                    append(escapeText(c))
+                continue
+            if c.__class__ is Markup:
+                append(c)
+                continue
+            if isinstance(c, TagBase):
+                if c._cache is not None and c is not filling:
+                    data = c._cache.get(uppercase)
+                    if data is None:
+                        data = _memoize(c, uppercase, lambda: _joinChunks(_iterRender(c, uppercase, c)))
+                    if data.__class__ in _FLUSHED:
+                        for segment in data.segments[:-1]:
+                            append(segment)
+                            yield ''.join(pieces)
+                            del pieces[:]
+                            yield FLUSH
+                        data = data.segments[-1]
+                    append(data)
+                    continue
+                if c.emptyTag:
+                    append(c._emptyTagString(uppercase))
+                    continue
+                stack.append((contents, etag))
+                contents = iter(c.contents)
+                if c.stag is None and c.etag is None and not c.attrs:
+                    tagName = c.tagName if uppercase else c.tagName.lower()
+                    append('<' + tagName + '>')
+                    etag = '</' + tagName + '>'
+                else:
+                    append(c._startTagString(uppercase))
+                    etag = c._endTagString(uppercase)
+                if len(pieces) >= _CHUNK_PIECES:
+                    yield ''.join(pieces)
+                    del pieces[:]
+                break
+            elif c.__class__ is FileInclude:
+                data = c.map()
+                if data.__class__ is Markup:
+                    append(data)
+                elif mapped:
+                    if pieces:
+                        yield ''.join(pieces)
+                        del pieces[:]
+                    yield c
+                else:
+                    append(data[:])
+            elif c is FLUSH:
+                if pieces:
+                    yield ''.join(pieces)
+                    del pieces[:]
+                yield FLUSH
+            elif not c:
+                continue
+            elif hasattr(c, 'toString'):
+                append(c.toString(uppercase))
+            else:
+                append(escapeText(c))
         else:
-            newOffset = ''.join([offset, indentChar])
-            contents = '\n'.join(['%s%s' % (newOffset, c.replace('<',LT).replace('>',GT)) if not hasattr(c,'toPrettyString') else c.toPrettyString(indentChar, newOffset, uppercase)
-                                  for c in self.contents if c])
-            data = ['%s%s' % (offset, self.stag) if self.stag is not None else '%s<%s%s>' % (offset, tagName, attrs),
-                    '%s' % (contents),
-                    '%s%s' % (offset, self.etag) if self.stag is not None else '%s</%s>' % (offset, tagName)]
-            data = '\n'.join([d for d in data if d])
+            if etag:
+                append(etag)
+            if not stack:
+                break
+            contents, etag = stack.pop()
+    if pieces:
+        yield ''.join(pieces)
 
-        return data
+def _iterRenderFlushing(tag, uppercase, mapped, flushAfter):
+    # _iterRender of tag with a FLUSH after the content flushAfter
+    yield tag._startTagString(uppercase)
+    for c in tag.contents:
+        for chunk in _iterRender(c, uppercase, mapped=mapped):
+            yield chunk
+        if c is flushAfter:
+            yield FLUSH
+    yield tag._endTagString(uppercase)
+
+# states of the contents of a tag being pretty printed
+_NO_CONTENTS, _EMPTY_CONTENTS, _CONTENTS = range(3)
+
+def _iterPrettyRender(root, indentChar, offset, uppercase, filling=None, flushAfter=None):
+    # Every tag is printed as its start line, its contents and its end line
+    # joined by newlines, where empty parts are skipped. A frame remembers
+    # whether the tag has printed anything yet (out) and whether its contents
+    # are still empty, so that the right separator precedes each line.
+    # The indent of each depth is made once and kept in indents. FLUSH is
+    # yielded after the end line of flushAfter, at flushDepth.
+    pieces = []
+    append = pieces.append
+    stack = []
+    contents = iter([root])
+    indents = [offset]
+    depth = 0
+    childOffset = offset
+    endLine = None
+    out = False
+    state = _NO_CONTENTS
+    flushDepth = None
+    while True:
+        for c in contents:
+            if c.__class__ is str:
+                if not c:
+                    continue
+                block = childOffset + escapeText(c)
+            elif c.__class__ is Markup:
+                if not c:
+                    continue
+                block = childOffset + c
+            elif isinstance(c, TagBase):
+                if c._cache is not None and c is not filling:
+                    key = (indentChar, childOffset, uppercase)
+                    block = c._cache.get(key)
+                    if block is None:
+                        block = _memoize(c, key, lambda: _joinChunks(_iterPrettyRender(c, indentChar, childOffset, uppercase, c)))
+                else:
+                    block = None
+            elif c.__class__ is FileInclude:
+                data = c.read()
+                if not data:
+                    continue
+                block = childOffset + data
+            elif c is FLUSH:
+                if pieces:
+                    yield ''.join(pieces)
+                    del pieces[:]
+                yield FLUSH
+                continue
+            elif not c:
+                continue
+            elif hasattr(c, 'toPrettyString'):
+                block = c.toPrettyString(indentChar, childOffset, uppercase)
+            else:
+                block = '%s%s' % (childOffset, escapeText(c))
 
+            if state == _CONTENTS:
+                append('\n')
+            elif state == _NO_CONTENTS:
+                if block is None or block:
+                    if out:
+                        append('\n')
+                    out = True
+                    state = _CONTENTS
+                else:
+                    state = _EMPTY_CONTENTS
+            else:
+                append('\n\n' if out else '\n')
+                out = True
+                state = _CONTENTS
+
+            if block is not None:
+                if block.__class__ in _FLUSHED:
+                    for segment in block.segments[:-1]:
+                        append(segment)
+                        yield ''.join(pieces)
+                        del pieces[:]
+                        yield FLUSH
+                    block = block.segments[-1]
+                append(block)
+            elif c.emptyTag:
+                append(c._prettyEmptyTagLine(childOffset, uppercase))
+            if block is not None or c.emptyTag:
+                if c is flushAfter:
+                    yield ''.join(pieces)
+                    del pieces[:]
+                    yield FLUSH
+                continue
+
+            if c.stag is None and not c.attrs:
+                tagName = c.tagName if uppercase else c.tagName.lower()
+                append(childOffset + '<' + tagName + '>')
+                stack.append((contents, depth, endLine, out, state))
+                endLine = childOffset + '</' + tagName + '>'
+                out = True
+            else:
+                startLine = c._prettyStartTagLine(childOffset, uppercase)
+                append(startLine)
+                stack.append((contents, depth, endLine, out, state))
+                endLine = c._prettyEndTagLine(childOffset, uppercase)
+                out = bool(startLine)
+            contents = iter(c.contents)
+            depth += 1
+            if c is flushAfter:
+                flushDepth = depth
+            if depth == len(indents):
+                indents.append(childOffset + indentChar)
+            childOffset = indents[depth]
+            state = _NO_CONTENTS
+            if len(pieces) >= _CHUNK_PIECES:
+                yield ''.join(pieces)
+                del pieces[:]
+            break
+        else:
+            if endLine:
+                if out:
+                    append('\n')
+                append(endLine)
+            if depth == flushDepth:
+                yield ''.join(pieces)
+                del pieces[:]
+                yield FLUSH
+                flushDepth = None
+            if not stack:
+                break
+            contents, depth, endLine, out, state = stack.pop()
+            childOffset = indents[depth]
+    if pieces:
+        yield ''.join(pieces)
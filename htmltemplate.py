@@ -0,0 +1,306 @@
+"""
+Templates compiled from a tree with slots.
+
+Put Slot instances in the contents of tags or as attribute values, and
+compile the tree once. The compiled Template keeps the markup between the
+slots as rendered strings, so that rendering it with the values of the slots
+is a single join:
+
+    page = PAGE(HEAD(TITLE(Slot('title'))), BODY(H1(Slot('title')), DIV(Slot('body'), CLASS=Slot('theme'))))
+    template = page.compile()
+    template.render({'title': 'News', 'body': P('...'), 'theme': 'dark'})
+
+specialize does the same for a function building a tree from its arguments:
+it traces the function once and generates a function writing the markup
+directly.
+"""
+import re
+import inspect
+import functools
+
+from htmlescape import Markup, markup, escapeText, escapeAttr
+
+
+# the marks the slots leave in the markup: NUL, 'a' for an attribute value or
+# 't' for a content, the name of the slot and NUL
+_MARK = re.compile('\0([at])([^\0]*)\0')
+
+
+class Slot(str):
+    '''
+    A placeholder for a value given when a compiled template is rendered.
+    A slot in the contents of a tag is filled with text, which is escaped,
+    Markup or a tag; a slot used as an attribute value is filled with a value
+    that is escaped as an attribute value.
+
+    A tree with slots renders the marks of the slots instead of their values,
+    so it is only meant to be compiled.
+    '''
+
+    def __new__(cls, name):
+        '''
+        name - [str] the name of the value filling the slot.
+        '''
+        if '\0' in name:
+            raise ValueError('the name of a slot cannot contain NUL: %r' % name)
+        slot = str.__new__(cls, '\0a%s\0' % name)
+        slot.name = name
+        return slot
+
+    def __repr__(self):
+        return 'Slot(%r)' % self.name
+
+    def __reduce__(self):
+        return (Slot, (self.name,))
+
+    def toString(self, uppercase=True):
+        return Markup('\0t%s\0' % self.name)
+
+    def toPrettyString(self, indentChar='    ', offset='', uppercase=True):
+        return Markup('%s\0t%s\0' % (offset, self.name))
+
+
+class Template(object):
+    '''
+    The markup of a tree split into the rendered strings between its slots
+    and the slots.
+    '''
+
+    def __init__(self, markup, uppercase=True):
+        '''
+        markup - [str] the markup rendered from a tree with slots.
+        uppercase - [bool] the case the tags filling the slots are written in.
+        '''
+        self.uppercase = uppercase
+        self._parts = []
+        self._slots = []
+        pieces = _MARK.split(markup)
+        for i in range(0, len(pieces), 3):
+            if pieces[i]:
+                self._parts.append(pieces[i])
+            if i + 2 < len(pieces):
+                self._slots.append((len(self._parts), pieces[i + 2], pieces[i + 1] == 'a'))
+                self._parts.append(None)
+
+    @property
+    def slots(self):
+        '''
+        names of the slots in the order they first appear in the markup, each
+        listed once
+        '''
+        names = []
+        for _, name, _ in self._slots:
+            if name not in names:
+                names.append(name)
+        return names
+
+    @property
+    def segments(self):
+        '''
+        the rendered strings between the slots
+        '''
+        return [part for part in self._parts if part is not None]
+
+    def render(self, data):
+        '''
+        Return the markup with the slots filled.
+
+        data - [mapping] the values of the slots by name. A content slot takes
+               a string, which is escaped, Markup, a tag or any object with a
+               toString method; an attribute slot takes any value, which is
+               escaped as an attribute value.
+        '''
+        parts = self._parts[:]
+        for index, name, attr in self._slots:
+            value = data[name]
+            if attr:
+                parts[index] = escapeAttr(value)
+            elif isinstance(value, basestring):
+                parts[index] = escapeText(value)
+            elif hasattr(value, 'toString'):
+                parts[index] = value.toString(self.uppercase)
+            else:
+                parts[index] = escapeText(str(value))
+        return markup(''.join(parts))
+
+
+class _Untraceable(Exception):
+    pass
+
+
+class _Tracer(object):
+    # An argument of a builder being traced. It stands for the value of the
+    # argument in the tree like a Slot, and fails any other use while the
+    # builder runs (tests, comparisons, formatting, iteration, ...).
+    __slots__ = ('name', 'built')
+
+    def __init__(self, name):
+        self.name = name
+        self.built = False
+
+    def _use(self):
+        if not self.built:
+            raise _Untraceable(self.name)
+
+    def __nonzero__(self):
+        self._use()
+        return True
+
+    def __str__(self):
+        self._use()
+        return '\0a%s\0' % self.name
+
+    def __hash__(self):
+        self._use()
+        return id(self)
+
+    def __eq__(self, other):
+        self._use()
+        return self is other
+
+    def __ne__(self, other):
+        self._use()
+        return self is not other
+
+    def __cmp__(self, other):
+        raise _Untraceable(self.name)
+
+    def toString(self, uppercase=True):
+        return Markup('\0t%s\0' % self.name)
+
+    def toPrettyString(self, indentChar='    ', offset='', uppercase=True):
+        return Markup('%s\0t%s\0' % (offset, self.name))
+
+
+def _render(tree, indentChar, offset, uppercase):
+    if indentChar:
+        return tree.toPrettyString(indentChar, offset, uppercase)
+    return tree.toString(uppercase)
+
+def _fill(uppercase):
+    # the function filling a content slot
+    def text(value):
+        if isinstance(value, basestring):
+            return escapeText(value)
+        if hasattr(value, 'toString'):
+            return value.toString(uppercase)
+        return escapeText(str(value))
+    return text
+
+def _generate(func, build, indentChar, offset, uppercase):
+    # Trace func with a _Tracer for each argument and return the function
+    # generated from the template of the tree it builds, or None when the
+    # tree cannot be built from tracers.
+    args = inspect.getargspec(func).args
+    tracers = [_Tracer(name) for name in args]
+    try:
+        tree = func(*tracers)
+        for tracer in tracers:
+            tracer.built = True
+        template = Template(_render(tree, indentChar, offset, uppercase), uppercase)
+    except Exception:
+        return None
+    namespace = {'_markup': markup, '_text': _fill(uppercase), '_attr': escapeAttr, '_build': build}
+    parts = []
+    for i, part in enumerate(template._parts):
+        if part is not None:
+            namespace['_part%d' % i] = part
+        parts.append('_part%d' % i)
+    for index, name, attr in template._slots:
+        parts[index] = '%s(%s)' % ('_attr' if attr else '_text', name)
+    if set(args) & set(namespace):
+        return None
+    lines = ['def render(%s):' % ', '.join(args)]
+    if args:
+        # None usually stands for a default the builder fills in
+        lines.append('    if %s:' % ' or '.join(['%s is None' % name for name in args]))
+        lines.append('        return _build(%s)' % ', '.join(args))
+    lines.append("    return _markup(''.join((%s)))" % ''.join([part + ', ' for part in parts]))
+    source = '\n'.join(lines) + '\n'
+    exec source in namespace
+    render = namespace['render']
+    render.__name__ = func.__name__
+    render.__defaults__ = func.__defaults__
+    render.source = source
+    return render
+
+def specialize(func=None, indentChar='', offset='', uppercase=True):
+    '''
+    Decorate a function building a tree or a page from its arguments, so
+    that it returns the markup of the tree instead.
+
+    The first call builds the tree with tracers standing for the arguments,
+    compiles it and generates a function joining the rendered strings of the
+    tree with the arguments, escaped as text or as attribute values. The
+    generated function is checked against the tree built from the first
+    arguments that are not None, and then replaces building and rendering.
+
+    The builder can only put its arguments into the tree as contents or
+    attribute values. One that tests, compares, formats or iterates them, or
+    that takes *args or **kargs, is called as it is and its tree rendered on
+    every call. So is the builder whenever an argument is None.
+
+    The builder is called twice on the first call, once with the tracers and
+    once with the arguments, and the markup around the arguments is frozen
+    from then on. A builder that also reads global or mutable state (ex. a
+    setting or the current date) keeps rendering what it read on the first
+    call; leave it undecorated or make that state one of its arguments.
+
+        @specialize
+        def page(title, body):
+            return PAGE(HEAD(TITLE(title)), BODY(H1(title), body))
+
+    func - [callable] the builder.
+    indentChar - [str] pretty print with this indent unless it is empty.
+    offset - [str] the indent of the tree when pretty printed.
+    uppercase - [bool] a flag to write tag and attribute names in uppercase.
+    '''
+    if func is None:
+        return lambda func: specialize(func, indentChar, offset, uppercase)
+
+    spec = inspect.getargspec(func)
+    # the generated function, whether it was checked, whether it failed
+    state = [None, False, bool(spec.varargs or spec.keywords)]
+
+    def build(*args, **kargs):
+        return _render(func(*args, **kargs), indentChar, offset, uppercase)
+
+    @functools.wraps(func)
+    def wrapper(*args, **kargs):
+        render, checked, failed = state
+        if checked:
+            return render(*args, **kargs)
+        if failed:
+            return build(*args, **kargs)
+        if render is None:
+            render = state[0] = _generate(func, build, indentChar, offset, uppercase)
+            if render is None:
+                state[2] = True
+                return build(*args, **kargs)
+        markup = build(*args, **kargs)
+        if all([val is not None for val in inspect.getcallargs(func, *args, **kargs).values()]):
+            if render(*args, **kargs) == markup:
+                state[1] = True
+            else:
+                state[0] = None
+                state[2] = True
+        return markup
+
+    return wrapper
+
+
+def compile(tree, indentChar='', offset='', uppercase=True):
+    '''
+    Compile a tree or a page with slots into a Template.
+
+    tree - [TagBase/PAGE] a tree or a page with Slot instances.
+    indentChar - [str] pretty print with this indent unless it is empty. The
+                 tags filling the slots are not pretty printed.
+    offset - [str] the indent of the tree when pretty printed.
+    uppercase - [bool] a flag to write tag and attribute names in uppercase.
+    '''
+    if indentChar:
+        markup = tree.toPrettyString(indentChar, offset, uppercase)
+    else:
+        markup = tree.toString(uppercase)
+    return Template(markup, uppercase)
@@ -0,0 +1,713 @@
+"""
+Micro benchmarks of PyHtml.
+
+usage: python tool/benchhtml.py [benchmark ...]
+
+Run all benchmarks when no name is given.
+"""
+import os
+import hashlib
+import sys
+import time
+import timeit
+import subprocess
+import shutil
+import tempfile
+import multiprocessing
+from collections import deque
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from html import *
+import htmltags
+import htmltagbase
+import htmlparallel
+import htmldiff
+import htmltemplate
+
+
+def bestOf(func, number, repeat=3):
+    return min(timeit.repeat(func, number=number, repeat=repeat)) / number
+
+def report(name, seconds, base=None):
+    if base is None:
+        print '    %-40s %10.3f ms' % (name, seconds * 1000)
+    else:
+        print '    %-40s %10.3f ms  (x%.2f)' % (name, seconds * 1000, base / seconds)
+
+#
+# fixtures
+#
+def wideTable(rows=500, cols=20):
+    return TABLE(*(TR(*(TD(SPAN('(%d,%d)' % (i, j))) for j in range(cols))) for i in range(rows)))
+
+def commentThread(depth=6, width=4):
+    def thread(level):
+        node = DIV(P('comment at level %d' % level), CLASS='comment')
+        if level < depth:
+            node.add(*(thread(level + 1) for _ in range(width)))
+        return node
+    return thread(0)
+
+def attributedTable(rows=500, cols=20):
+    return TABLE(*(TR(*(TD(SPAN('(%d,%d)' % (i, j), CLASS='v'), ALIGN='right', ID='c%d_%d' % (i, j)) for j in range(cols)),
+                      ONMOUSEOVER="this.style.background='pink';", ONMOUSEOUT="this.style.background='white';")
+                   for i in range(rows)))
+
+def handlerTable(rows=200, cols=10):
+    return TABLE(*(TR(*(TD('(%d,%d)' % (i, j), ID='c%d_%d' % (i, j), CLASS='cell', ONCLICK='pick(%d,%d);' % (i, j),
+                           ONMOUSEOVER="this.style.background='pink';", ONMOUSEOUT="this.style.background='white';")
+                        for j in range(cols)),
+                      ONMOUSEOVER="this.style.background='pink';", ONMOUSEOUT="this.style.background='white';")
+                   for i in range(rows)))
+
+def deepOutline(depth=400):
+    node = SPAN('leaf')
+    for i in range(depth):
+        node = LI(UL(node), 'item %d' % i)
+    return node
+
+def nodeBytes(node):
+    '''
+    Approximate the bytes owned by a tag instance, not counting its contents.
+    '''
+    size = sys.getsizeof(node)
+    values = []
+    if hasattr(node, '__dict__'):
+        size += sys.getsizeof(node.__dict__)
+        values.extend(node.__dict__.values())
+    for cls in type(node).__mro__ if hasattr(type(node), '__mro__') else []:
+        for name in cls.__dict__.get('__slots__', ()):
+            if name != '__weakref__' and hasattr(node, name):
+                values.append(getattr(node, name))
+    for val in values:
+        if isinstance(val, (list, deque, dict, set, frozenset)):
+            size += sys.getsizeof(val)
+            if isinstance(val, list):
+                size += sum([sys.getsizeof(v) for v in val if isinstance(v, tuple)])
+    return size
+
+def treeBytes(tree):
+    '''
+    Return the number of distinct tags in tree and the bytes they own.
+    '''
+    count, size = 0, 0
+    seen = set()
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        count += 1
+        size += nodeBytes(node)
+        stack.extend([c for c in node.contents if isinstance(c, TagBase)])
+    return count, size
+
+#
+# the former per instance attribute sets, kept as a reference
+#
+class LegacyTD(TD):
+
+    ATTRS = sorted(TD.attrset)
+
+    def __init__(self, *contents, **attrs):
+        TagBase.__init__(self, "TD", *contents, emptyTag=False)
+        self.attrset = frozenset(list(self.ATTRS))
+        self.legacyAttrlist = deque()
+        self.setAttr(**attrs)
+
+#
+# the former attribute string, kept as a reference
+#
+def legacyAttrString(self, uppercase):
+    if not self.attrs:
+        return ''
+    if uppercase:
+        attrs = ' '.join(['%s="%s"' % (a.replace('__',':').replace('_','-'), v) for a, v in self.attrs])
+    else:
+        attrs = ' '.join(['%s="%s"' % (a.replace('__',':').replace('_','-').lower(), v) for a, v in self.attrs])
+    return ''.join([' ', attrs]) if attrs else ''
+
+#
+# the former recursive serializers, kept as a reference
+#
+def recursiveToString(tag, uppercase=True):
+    attrs = ' '.join(['%s="%s"' % (a.replace('__',':').replace('_','-') if uppercase else a.replace('__',':').replace('_','-').lower(), v) for a, v in tag.attrs or ()])
+    tagName = tag.tagName if uppercase else tag.tagName.lower()
+    if attrs:
+        attrs = ''.join([' ', attrs])
+    if tag.emptyTag:
+        return '%s%s%s' % (tag.stag if tag.stag is not None else '<%s' % (tagName),
+                           attrs,
+                           tag.etag if tag.etag is not None else ' />')
+    contents = ''.join([c.replace('<',LT).replace('>',GT) if not hasattr(c,'toString') else recursiveToString(c, uppercase) for c in tag.contents if c])
+    data = [tag.stag if tag.stag is not None else '<%s%s>' % (tagName, attrs),
+            contents,
+            tag.etag if tag.etag is not None else '</%s>' % tagName]
+    return ''.join([d for d in data if d])
+
+def recursiveToPrettyString(tag, indentChar='    ', offset='', uppercase=True):
+    attrs = ' '.join(['%s="%s"' % (a.replace('__',':').replace('_','-') if uppercase else a.replace('__',':').replace('_','-').lower(), v) for a, v in tag.attrs or ()])
+    tagName = tag.tagName if uppercase else tag.tagName.lower()
+    if attrs:
+        attrs = ''.join([' ', attrs])
+    if tag.emptyTag:
+        return '%s<%s%s />' % (offset, tagName, attrs)
+    newOffset = ''.join([offset, indentChar])
+    contents = '\n'.join(['%s%s' % (newOffset, c.replace('<',LT).replace('>',GT)) if not hasattr(c,'toPrettyString') else recursiveToPrettyString(c, indentChar, newOffset, uppercase)
+                          for c in tag.contents if c])
+    data = ['%s%s' % (offset, tag.stag) if tag.stag is not None else '%s<%s%s>' % (offset, tagName, attrs),
+            contents,
+            '%s%s' % (offset, tag.etag) if tag.stag is not None else '%s</%s>' % (offset, tagName)]
+    return '\n'.join([d for d in data if d])
+
+#
+# benchmarks
+#
+def benchSerializer():
+    '''
+    explicit stack serializer vs the former recursive one
+    '''
+    sys.setrecursionlimit(20000)
+    for name, tree in [('wide table (500x20)', wideTable()),
+                       ('comment thread (4^6)', commentThread()),
+                       ('deep outline (400)', deepOutline())]:
+        print '  %s' % name
+        base = bestOf(lambda: recursiveToString(tree), 5)
+        report('recursive toString', base)
+        report('toString', bestOf(lambda: tree.toString(), 5), base)
+        base = bestOf(lambda: recursiveToPrettyString(tree), 5)
+        report('recursive toPrettyString', base)
+        report('toPrettyString', bestOf(lambda: tree.toPrettyString(), 5), base)
+
+def benchPretty():
+    '''
+    toPrettyString time per output byte as the trees grow deeper and wider
+    '''
+    sys.setrecursionlimit(20000)
+    for name, make, sizes in [('deep outline', deepOutline, [250, 500, 1000, 2000]),
+                              ('wide table', lambda rows: wideTable(rows, 20), [125, 250, 500, 1000])]:
+        print '  %s' % name
+        for size in sizes:
+            tree = make(size)
+            length = len(tree.toPrettyString())
+            seconds = bestOf(lambda: tree.toPrettyString(), 3)
+            print '    %-40s %10.3f ms %8.2f ns per byte' % ('%d (%d bytes)' % (size, length), seconds * 1000, seconds * 1e9 / length)
+
+def benchRenderCache():
+    '''
+    re-rendering a page whose head and navigation are memoized
+    '''
+    def page(cache):
+        head = HEAD(TITLE('report'), *(LINK(REL='stylesheet', HREF='style%d.css' % i) for i in range(10)))
+        nav = DIV(UL(*(LI(A('section %d' % i, HREF='#s%d' % i)) for i in range(200))), ID='nav')
+        table = wideTable(50, 10)
+        if cache:
+            head.setCache()
+            nav.setCache()
+        return PAGE(head, BODY(nav, table))
+    base = bestOf(page(False).toString, 20)
+    report('toString', base)
+    report('toString with memoized head and nav', bestOf(page(True).toString, 20), base)
+
+def benchAttrNames():
+    '''
+    rendering attribute names from the precomputed table vs replacing on every render
+    '''
+    tree = handlerTable()
+    for uppercase in [True, False]:
+        print '  %s' % ('uppercase' if uppercase else 'lowercase')
+        attrString = TagBase._attrString
+        TagBase._attrString = legacyAttrString
+        try:
+            base = bestOf(lambda: tree.toString(uppercase), 10, 7)
+        finally:
+            TagBase._attrString = attrString
+        report('toString replacing names', base)
+        report('toString with the name table', bestOf(lambda: tree.toString(uppercase), 10, 7), base)
+
+def benchEscape():
+    '''
+    escaping text with escapeText vs the former replace chain
+    '''
+    for name, text in [('short text', '(12,3)'),
+                       ('paragraph', 'The quick brown fox jumps over the lazy dog. ' * 10),
+                       ('text with < and >', 'if a < b and b > c then a < c ' * 3),
+                       ('text with entities', 'Copyright &copy; 2012&nbsp;PyHtml'),
+                       ('text with bare &', 'Tom & Jerry, Laurel & Hardy'),
+                       ('long text', ('The quick brown fox jumps over the lazy dog. ' * 50 + 'a < b & c. ') * 40),
+                       ('long text, nothing to escape', 'The quick brown fox jumps over the lazy dog. ' * 2000),
+                       ]:
+        print '  %s' % name
+        number = 100000 if len(text) < 1000 else 100
+        base = bestOf(lambda: text.replace('<',LT).replace('>',GT), number)
+        report('1000 x replace chain (<, > only)', base * 1000)
+        report('1000 x escapeText', bestOf(lambda: escapeText(text), number) * 1000, base * 1000)
+    print '  attribute value'
+    report('1000 x escapeAttr', bestOf(lambda: escapeAttr("this.style.background='pink';"), 100000) * 1000)
+
+def benchIncludes():
+    '''
+    building and rendering pages with file includes, read eagerly vs through the include cache
+    '''
+    root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'test')
+    script, partial = os.path.join(root, 'alert.js'), os.path.join(root, 'partial.html')
+    def readFile(path):
+        # the former addFromFile
+        with open(os.path.abspath(os.path.expanduser(path)), 'r') as f:
+            return Markup(f.read())
+    def eager():
+        return DIV(SCRIPT(readFile(script)), DIV(readFile(partial)), P('text')).toString()
+    def cached():
+        return DIV(SCRIPT().addFromFile(script), DIV().addFromFile(partial), P('text')).toString()
+    base = bestOf(eager, 1000)
+    report('page with read includes', base)
+    report('page with cached includes', bestOf(cached, 1000), base)
+
+    fd, path = tempfile.mkstemp('.html')
+    try:
+        os.write(fd, '<P>a paragraph of a large partial</P>\n' * 100000)
+        os.close(fd)
+        tree = DIV(P('before'), DIV().addFromFile(path), P('after'))
+        out = open(os.devnull, 'w')
+        print '  %d bytes include' % os.path.getsize(path)
+        base = bestOf(lambda: out.write(tree.toString()), 20)
+        report('write toString', base)
+        report('renderTo with the include mapped', bestOf(lambda: tree.renderTo(out), 20), base)
+        out.close()
+    finally:
+        os.remove(path)
+
+def benchSplice():
+    '''
+    saving a page made of large includes, copied by the kernel vs through python
+    '''
+    paths = []
+    for i in range(4):
+        fd, path = tempfile.mkstemp('.html')
+        os.write(fd, '<P>paragraph %d of a large partial</P>\n' % i * 50000)
+        os.close(fd)
+        paths.append(path)
+    fd, out = tempfile.mkstemp('.html')
+    os.close(fd)
+    try:
+        page = PAGE(body=BODY(*[DIV(H2('part %d' % i)).addFromFile(path) for i, path in enumerate(paths)]))
+        size = sum([os.path.getsize(path) for path in paths])
+        def save():
+            page.save(out)
+        def saveString():
+            with open(out, 'w') as f:
+                f.write(page.toString())
+        sendfile = htmltagbase._getSendfile()
+        print '  %d bytes of includes, sendfile %s' % (size, 'available' if sendfile else 'not available')
+        base = bestOf(saveString, 20)
+        report('write toString', base)
+        htmltagbase._sendfile[:] = [None]
+        try:
+            report('save with buffered includes', bestOf(save, 20), base)
+        finally:
+            htmltagbase._sendfile[:] = [sendfile]
+        spliced = bestOf(save, 20)
+        report('save with spliced includes', spliced, base)
+        print '    %-40s %10.1f MB/s' % ('throughput of save', size / spliced / 1e6)
+    finally:
+        for path in paths + [out]:
+            os.remove(path)
+
+def benchParallel():
+    '''
+    rendering a page of large sections with renderParallel vs toString
+    '''
+    page = PAGE(body=BODY(H1('report'),
+                          *[DIV(H2('section %d' % i), wideTable(500, 20), ID='s%d' % i) for i in range(4)]))
+    print '  %d CPUs' % multiprocessing.cpu_count()
+    base = bestOf(page.toString, 3)
+    report('toString', base)
+    report('renderParallel', bestOf(lambda: htmlparallel.renderParallel(page), 3), base)
+
+def benchRenderMany():
+    '''
+    saving 2000 small pages with renderMany vs one by one
+    '''
+    root = tempfile.mkdtemp()
+    try:
+        pages = [(PAGE(HEAD(TITLE('page %d' % i)), BODY(H1('page %d' % i), wideTable(5, 5))),
+                  os.path.join(root, 'page%d.html' % i)) for i in range(2000)]
+        def serial():
+            for page, filePath in pages:
+                page.save(filePath)
+        workers = max(2, multiprocessing.cpu_count())
+        print '  %d CPUs, %d workers' % (multiprocessing.cpu_count(), workers)
+        base = bestOf(serial, 1)
+        report('save one by one', base)
+        report('renderMany one page per chunk', bestOf(lambda: htmlparallel.renderMany(pages, workers, 1), 1), base)
+        report('renderMany default chunks', bestOf(lambda: htmlparallel.renderMany(pages, workers), 1), base)
+        # a pool of the caller replacing its processes after every chunk
+        pool = multiprocessing.Pool(workers, maxtasksperchild=1)
+        try:
+            report('renderMany given pool', bestOf(lambda: htmlparallel.renderMany(pages, workers, pool=pool), 1), base)
+        finally:
+            pool.close()
+            pool.join()
+        for page, filePath in pages[::100]:
+            assert open(filePath).read() == page.toString()
+    finally:
+        shutil.rmtree(root)
+
+def benchStream():
+    '''
+    event loop stalls while a large page is sent by toString vs renderToStream
+    '''
+    try:
+        import trollius as asyncio
+        from trollius import From
+    except ImportError:
+        print '  trollius is not installed'
+        return
+    page = PAGE(body=BODY(wideTable(1000, 20)))
+    unicodePage = PAGE(HEAD(TITLE(u'caf\xe9')), BODY(*[P(u'\u2603 %d' % i) for i in range(5000)]))
+    delays = []
+
+    @asyncio.coroutine
+    def ticker(done):
+        while not done:
+            start = time.time()
+            yield From(asyncio.sleep(0.001))
+            delays.append(time.time() - start)
+
+    @asyncio.coroutine
+    def handle(reader, writer):
+        stream = yield From(reader.readline())
+        if stream.strip() == 'unicode':
+            yield From(unicodePage.renderToStream(writer))
+        elif stream.strip():
+            yield From(page.renderToStream(writer))
+        else:
+            writer.write(page.toString())
+            yield From(writer.drain())
+        writer.close()
+
+    @asyncio.coroutine
+    def fetch(port, stream):
+        done = []
+        del delays[:]
+        task = asyncio.async(ticker(done))
+        reader, writer = yield From(asyncio.open_connection('127.0.0.1', port))
+        writer.write('stream\n' if stream else '\n')
+        start = time.time()
+        yield From(reader.read())
+        seconds = time.time() - start
+        done.append(True)
+        yield From(task)
+        writer.close()
+        raise asyncio.Return(seconds)
+
+    @asyncio.coroutine
+    def run():
+        server = yield From(asyncio.start_server(handle, '127.0.0.1', 0))
+        port = server.sockets[0].getsockname()[1]
+        for name, stream in [('toString', False), ('renderToStream', True)]:
+            seconds = yield From(fetch(port, stream))
+            print '    %-40s %10.3f ms  longest stall %.1f ms' % (name, seconds * 1000, max(delays) * 1000)
+        # a unicode page is sent whole, encoded as UTF-8
+        reader, writer = yield From(asyncio.open_connection('127.0.0.1', port))
+        writer.write('unicode\n')
+        data = yield From(asyncio.wait_for(reader.read(), 10))
+        writer.close()
+        assert data == unicodePage.toString().encode('utf-8')
+        server.close()
+
+    asyncio.get_event_loop().run_until_complete(run())
+
+def benchFlush():
+    '''
+    time until the HEAD of a large page is written by toString vs renderTo
+    '''
+    page = PAGE(HEAD(TITLE('report'), LINK(REL='stylesheet', HREF='report.css')),
+                BODY(wideTable(2000, 20)))
+    class Sink(object):
+        def __init__(self):
+            self.first = None
+        def write(self, data):
+            if self.first is None:
+                self.first = time.time()
+        def flush(self):
+            self.write('')
+    def firstByte(render):
+        times = []
+        for _ in range(5):
+            sink = Sink()
+            start = time.time()
+            render(sink)
+            times.append(sink.first - start)
+        return min(times)
+    base = firstByte(lambda sink: sink.write(page.toString()))
+    report('toString', base)
+    report('renderTo', firstByte(page.renderTo), base)
+    report('renderTo pretty printed', firstByte(lambda sink: page.renderTo(sink, '  ')), base)
+
+    # the HEAD is flushed when pretty printed, and when HTML has a memo
+    def head(chunks):
+        chunks = list(chunks)
+        return ''.join(chunks[:[c is FLUSH for c in chunks].index(True)])
+    assert head(page.iterPrettyRender('  ')).endswith('</HEAD>')
+    page.html.setCache()
+    page.toString()
+    assert head(page.iterRender()).endswith('</HEAD>')
+    page.html.setCache(False)
+    # a FLUSH in a subtree with a memo, or with a fragment, is kept by it
+    for shared in [False, True]:
+        tree = BODY(DIV(P('first'), FLUSH, P('second')).setCache(shared=shared), P('last'))
+        for render in [lambda: tree.iterRender(), lambda: tree.iterPrettyRender('  ')]:
+            markup = ''.join(render())
+            assert markup in (tree.toString(), tree.toPrettyString('  '))
+            for _ in range(2):
+                flushed = head(render())
+                assert 'first' in flushed and 'second' not in flushed and ''.join(render()) == markup
+
+def benchDiff():
+    '''
+    patching a rebuilt dashboard with htmldiff vs sending it again
+    '''
+    def dashboard(tick):
+        return TABLE(*[TR(*[TD(str(tick if (i, j) in [(3, 4), (250, 7), (499, 19)] else i * j))
+                            for j in range(20)], ID='row%d' % i) for i in range(500)])
+    old, new = dashboard(0), dashboard(1)
+    base = bestOf(new.toString, 5)
+    report('toString', base)
+    report('diff', bestOf(lambda: htmldiff.diff(old, new), 5), base)
+    print '    %-40s %10d operations' % ('changed cells', len(htmldiff.diff(old, new)))
+    rows = old.contents[:]
+    moved = TABLE(*(rows[1:] + rows[:1]))
+    report('diff after moving the first row', bestOf(lambda: htmldiff.diff(old, moved), 5), base)
+    print '    %-40s %10d operations' % ('moved row', len(htmldiff.diff(old, moved)))
+    # a new tree sharing rows with the old one: patching leaves it as it is
+    rows = [TR(TD('r%d' % i)) for i in range(3)]
+    shared, prepended = TABLE(*rows), TABLE(TR(TD('new')), *rows)
+    markup = prepended.toString()
+    htmldiff.patch(shared, htmldiff.diff(shared, prepended))
+    assert shared.toString() == prepended.toString() == markup
+    # one cell changed in a large table sharing its other rows with the old
+    # one: diff compares the changed row only, never the whole tree
+    rows = [TR(*[TD(str(j)) for j in range(100)]) for i in range(1000)]
+    row = TR(*[TD('changed' if j == 50 else str(j)) for j in range(100)])
+    large, changed = TABLE(*rows), TABLE(*(rows[:500] + [row] + rows[501:]))
+    base = bestOf(changed.toString, 1)
+    report('toString of 1000 shared rows', base)
+    seconds = bestOf(lambda: htmldiff.diff(large, changed), 5)
+    report('diff after changing one of them', seconds, base)
+    assert seconds * 10 < base
+
+def benchETag():
+    '''
+    ETag of a large page from fingerprints vs hashing its markup
+    '''
+    page = PAGE(HEAD(TITLE('report')), BODY(*[DIV(H2('section %d' % i), wideTable(100, 20)) for i in range(10)]))
+    base = bestOf(lambda: hashlib.sha1(page.toString()).hexdigest(), 5)
+    report('sha1 of toString', base)
+    def fresh():
+        stack = [page.doctype, page.html]
+        while stack:
+            tag = stack.pop()
+            tag._fingerprint = None
+            stack.extend([c for c in tag.contents if isinstance(c, TagBase)])
+        return page.etag()
+    report('etag of an unhashed page', bestOf(fresh, 5), base)
+    report('etag of a hashed page', bestOf(page.etag, 5), base)
+    cell = page.body.contents[5].contents[1].contents[50].contents[10]
+    def changed():
+        cell.set('changed')
+        return page.etag()
+    report('etag after changing a cell', bestOf(changed, 5), base)
+
+def catalog(items=2000):
+    return PAGE(HEAD(TITLE('catalog')),
+                BODY(*[DIV(H3('product %d' % i), SPAN(CLASS='icon icon-star'), SPAN(CLASS='icon icon-star'),
+                           SPAN(CLASS='icon icon-cart'), BR(),
+                           TABLE(TR(TD('price'), TD('$%d' % (i % 50)), TD()), TR(TD('stock'), TD('in stock'), TD())),
+                           HR(), ID='product%d' % i)
+                       for i in range(items)]))
+
+def textBytes(tree):
+    '''
+    Return the bytes of the distinct text strings in tree.
+    '''
+    texts = {}
+    stack = [tree]
+    while stack:
+        node = stack.pop()
+        for c in node.contents:
+            if isinstance(c, TagBase):
+                stack.append(c)
+            elif isinstance(c, str):
+                texts[id(c)] = sys.getsizeof(c)
+    return sum(texts.values())
+
+def benchDedupe():
+    '''
+    memory and rendering of a catalog page before and after dedupe
+    '''
+    page = catalog()
+    base = bestOf(page.toString, 5)
+    before = treeBytes(page.html) + (textBytes(page.html),)
+    report('dedupe', bestOf(lambda: dedupe(catalog()), 1) - bestOf(catalog, 1))
+    dedupe(page)
+    after = treeBytes(page.html) + (textBytes(page.html),)
+    for name, (count, size, text) in [('before', before), ('after', after)]:
+        print '    %-40s %10d tags %8d bytes %8d bytes of text' % (name, count, size, text)
+    print '    %-40s %9.1f%%' % ('memory saved', 100.0 - 100.0 * (after[1] + after[2]) / (before[1] + before[2]))
+    report('toString', base)
+    report('toString of the deduplicated page', bestOf(page.toString, 5), base)
+
+def benchFragments():
+    '''
+    pages built independently around an equal sidebar, with and without the
+    fragment cache
+    '''
+    def sidebar():
+        return DIV(H3('categories'),
+                   UL(*[LI(A('category %d' % i, HREF='/category/%d' % i), SPAN('(%d)' % (i * 7), CLASS='count'))
+                        for i in range(200)]), CLASS='sidebar')
+    def pages(shared):
+        return [PAGE(HEAD(TITLE('page %d' % n)),
+                     BODY(sidebar().setCache(shared=shared), DIV(P('article %d' % n), CLASS='main')))
+                for n in range(50)]
+
+    def render(shared, pretty):
+        times = []
+        for _ in range(5):
+            built = pages(shared)
+            htmltagbase.fragments.clear()
+            start = time.time()
+            for page in built:
+                if pretty:
+                    page.toPrettyString()
+                else:
+                    page.toString()
+            times.append(time.time() - start)
+        memos = dict([(id(data), len(data)) for page in built for data in page.body.contents[0]._cache.values()])
+        return min(times), sum(memos.values())
+    for mode, pretty in [('toString', False), ('toPrettyString', True)]:
+        base, size = render(False, pretty)
+        report('%s, memo per tree' % mode, base)
+        print '    %-40s %10d characters' % ('memoized sidebars', size)
+        seconds, size = render(True, pretty)
+        report('%s, fragment cache' % mode, seconds, base)
+        print '    %-40s %10d characters' % ('memoized sidebars', size)
+    stats = htmltagbase.fragments.stats()
+    print '    %-40s %d hits %d misses %d evictions' % ('fragment cache', stats['hits'], stats['misses'], stats['evictions'])
+
+def benchTemplate():
+    '''
+    a page skeleton with 30 varying values, built and rendered per request vs
+    rendered from a compiled template
+    '''
+    def build(value):
+        return PAGE(HEAD(TITLE(value('title')), LINK(REL='stylesheet', HREF='/site.css')),
+                    BODY(DIV(H1(value('title')), UL(*[LI(A('section %d' % i, HREF='/s/%d' % i)) for i in range(20)]),
+                             CLASS='header'),
+                         TABLE(*[TR(TD('field %d' % i, CLASS='name'), TD(value('v%d' % i), CLASS=value('c%d' % i)))
+                                 for i in range(14)]),
+                         DIV(P('static footer text'), ID='footer')))
+    data = dict([('title', 'report')] + [('v%d' % i, 'value %d' % i) for i in range(14)] +
+                [('c%d' % i, 'odd' if i % 2 else 'even') for i in range(14)])
+    template = build(htmltemplate.Slot).compile()
+    assert template.render(data) == build(data.get).toString()
+    # the title fills two slots and is listed once
+    assert template.slots[0] == 'title' and sorted(template.slots) == sorted(data)
+    base = bestOf(lambda: build(data.get).toString(), 200)
+    report('build and toString', base)
+    report('render a compiled template', bestOf(lambda: template.render(data), 200), base)
+    print '    %-40s %10d segments %d slots' % ('template', len(template.segments), len(template.slots))
+
+def benchSpecialize():
+    '''
+    a page builder called per request, building and rendering its tree vs
+    specialized by htmltemplate.specialize
+    '''
+    def article(title, author, date, summary, body, theme):
+        return PAGE(HEAD(TITLE(title), LINK(REL='stylesheet', HREF='/site.css')),
+                    BODY(DIV(H1(title), UL(*[LI(A('section %d' % i, HREF='/s/%d' % i)) for i in range(20)]),
+                             CLASS='header'),
+                         DIV(H2(title), P('by ', SPAN(author, CLASS='author'), ' on ', SPAN(date, CLASS='date')),
+                             P(summary, CLASS='summary'), DIV(body, CLASS='body'), CLASS=theme),
+                         DIV(P('static footer text'), ID='footer')))
+    specialized = htmltemplate.specialize(article)
+    args = ('Release notes', 'alice', '2016-10-18', 'what changed & why', P('the body'), 'dark')
+    assert specialized(*args) == article(*args).toString()
+    base = bestOf(lambda: article(*args).toString(), 200)
+    report('build and toString', base)
+    report('specialized', bestOf(lambda: specialized(*args), 200), base)
+
+def benchConstruction():
+    '''
+    constructing tags with class level attribute sets
+    '''
+    for name, cls in [('per instance attribute set', LegacyTD), ('class level attribute set', TD)]:
+        print '  %s' % name
+        report('construct 10000 TD', bestOf(lambda: [cls('cell') for _ in xrange(10000)], 5))
+        report('construct 10000 TD with CLASS', bestOf(lambda: [cls('cell', CLASS='c') for _ in xrange(10000)], 5))
+        print '    %-40s %10d bytes' % ('bytes per TD', nodeBytes(cls('cell')))
+        print '    %-40s %10d bytes' % ('bytes per TD with CLASS', nodeBytes(cls('cell', CLASS='c')))
+
+def benchMemory():
+    '''
+    memory owned by the tags of a tree
+    '''
+    for name, tree in [('wide table (500x20)', wideTable()),
+                       ('attributed table (500x20)', attributedTable())]:
+        count, size = treeBytes(tree)
+        print '    %-40s %10d tags %8.1f bytes per tag' % (name, count, float(size) / count)
+    attrsets = dict([(id(cls.attrset), cls.attrset) for cls in [getattr(htmltags, tag) for tag in htmltags._TAGS]])
+    print '    %-40s %10d sets %8d bytes' % ('attribute sets of the tag classes', len(attrsets),
+                                             sum([sys.getsizeof(s) for s in attrsets.values()]))
+
+def benchImport():
+    '''
+    start up time of a fresh interpreter importing html
+    '''
+    root = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+    def startup(code):
+        cmd = [sys.executable, '-c', code]
+        return bestOf(lambda: subprocess.check_call(cmd, cwd=root), 10)
+    bare = startup('pass')
+    report('bare interpreter', bare)
+    for code in ['import html', 'import html; html.DIV', 'from html import *']:
+        report(code, startup(code) - bare)
+
+
+BENCHMARKS = [
+    ('serializer', benchSerializer),
+    ('pretty', benchPretty),
+    ('cache', benchRenderCache),
+    ('attrnames', benchAttrNames),
+    ('escape', benchEscape),
+    ('includes', benchIncludes),
+    ('splice', benchSplice),
+    ('parallel', benchParallel),
+    ('many', benchRenderMany),
+    ('stream', benchStream),
+    ('flush', benchFlush),
+    ('diff', benchDiff),
+    ('etag', benchETag),
+    ('dedupe', benchDedupe),
+    ('fragments', benchFragments),
+    ('template', benchTemplate),
+    ('specialize', benchSpecialize),
+    ('construction', benchConstruction),
+    ('memory', benchMemory),
+    ('import', benchImport),
+    ]
+
+def main():
+    names = sys.argv[1:] or [name for name, _ in BENCHMARKS]
+    for name, bench in BENCHMARKS:
+        if name in names:
+            print '%s: %s' % (name, bench.__doc__.strip())
+            bench()
+            print
+
+
+if __name__ == '__main__':
+    main()
@@ -1,3 +1,4 @@
+import os
 import re
 import httplib
 import sys
@@ -200,7 +201,7 @@ def getTagInfo(conn, tagPage):
                 info['eventAttrs'] = getAttr(data, '<h2>Event Attributes</h2>')
     return info
 
-def genPyClass(tag, isEmptyTag, globalAttrs, eventAttrs, tagInfo):
+def getAllAttrs(globalAttrs, eventAttrs, tagInfo):
     allAttrs = [a[0] for a in tagInfo['attrs']]
     allAttrs.extend([a[0] for a in tagInfo['requiredAttrs']])
     allAttrs.extend([a[0] for a in tagInfo['optionalAttrs']])
@@ -216,6 +217,43 @@ def genPyClass(tag, isEmptyTag, globalAttrs, eventAttrs, tagInfo):
         else:
             allAttrs.extend([a[0] for a in tagInfo['eventAttrs']])
 
+    return [a for i, a in enumerate(allAttrs) if a not in allAttrs[:i]]
+
+def getAttrGroups(eventAttrs, tagInfo):
+    groups = []
+    if tagInfo['globalAttrs']:
+        groups.append('global')
+    if tagInfo['eventAttrs'] == True:
+        groups.extend(sorted(eventAttrs.keys()))
+    return groups
+
+def genGroupSpec(globalAttrs, eventAttrs):
+    groups = [('global', globalAttrs)] + sorted(eventAttrs.items())
+    return ''.join(['\t"%s": attrGroup((%s%s)),\n' % (group,
+                                             ','.join(['"%s"' % a[0] for a in attrs]),
+                                             ',' if len(attrs) == 1 else ''
+                                             ) for group, attrs in groups])
+
+def genTagSpec(tag, isEmptyTag, globalAttrs, eventAttrs, tagInfo):
+    groups = getAttrGroups(eventAttrs, tagInfo)
+    grouped = []
+    if tagInfo['globalAttrs']:
+        grouped.extend([a[0] for a in globalAttrs])
+    if tagInfo['eventAttrs'] == True:
+        for key, val in eventAttrs.items():
+            grouped.extend([a[0] for a in val])
+    ownAttrs = [a for a in getAllAttrs(globalAttrs, eventAttrs, tagInfo) if a not in grouped]
+    return '\t"%s": (%s, (%s%s), (%s%s)),\n' % (tag.upper(),
+                                                isEmptyTag,
+                                                ','.join(['"%s"' % a for a in ownAttrs]),
+                                                ',' if len(ownAttrs) == 1 else '',
+                                                ','.join(['"%s"' % g for g in groups]),
+                                                ',' if len(groups) == 1 else ''
+                                                )
+
+def genTagDoc(tag, isEmptyTag, globalAttrs, eventAttrs, tagInfo):
+    allAttrs = getAllAttrs(globalAttrs, eventAttrs, tagInfo)
+
     definitionStr = '\n'.join([
         '\t[Definition and Usage]',
         '%s' % '\n'.join(['\t\t%s' % d for d in tagInfo['tagdef']])
@@ -309,17 +347,12 @@ def genPyClass(tag, isEmptyTag, globalAttrs, eventAttrs, tagInfo):
                                                ) for attr, type, desc in tagInfo['eventAttrs']])
             ])
 
-    data = ['class %s(TagBase):' % tag.upper(),
-            "\t'''",
+    data = ['"%s": \'\'\'' % tag.upper(),
             definitionStr,
             browserSupportStr,
             htmlSupportStr,
             tipsStr,
-            "\t'''",
-            '\tdef __init__(self%s%s):' % ('' if isEmptyTag else ', *contents',
-                                           ', **attrs' if allAttrs else ''
-                                           ),
-            '\t\t"""',
+            '\t[Arguments]',
             '%s%s' % ('' if isEmptyTag else '\t\t*contents - [tuple] tag contents.\n',
                      '\t\t**attrs - [dict] tag attributes.\n' if allAttrs else ''
                      ),
@@ -329,15 +362,8 @@ def genPyClass(tag, isEmptyTag, globalAttrs, eventAttrs, tagInfo):
             stdAttrStr,
             glbAttrStr,
             evtAttrStr,
-            '\t\t"""',
-            '\t\tTagBase.__init__(self, "%s"%s, emptyTag=%s)' % (tag.upper(),
-                                                                 '' if isEmptyTag else ', *contents',
-                                                                 isEmptyTag
-                                                                 ),
-            '' if not allAttrs else '%s\n%s' % ('\t\tself.attrset = frozenset([%s])' % ','.join(['"%s"' % a for a in allAttrs]),
-                                                '\t\tself.setAttr(**attrs)'
-                                                ),
-            '\n\n',
+            "\t\t''',",
+            '\n',
             ]
     
     return '\n'.join([d for d in data if d])
@@ -350,6 +376,7 @@ def main():
         sys.exit(1)
 
     fname = sys.argv[1]
+    docFname = os.path.join(os.path.dirname(fname), 'htmltagdocs.py')
 
     conn = httplib.HTTPConnection('www.w3schools.com')
 
@@ -360,8 +387,6 @@ def main():
     globalAttrs   = getGlobalAttr(conn)
     eventAttrs    = getEventAttrs(conn)
 
-    f = open(fname, 'w')
-
     cmt = [
     '"""',
     '%s' % datetime.datetime.now().strftime('%Y/%m/%d %H:%M:%S'),
@@ -370,9 +395,8 @@ def main():
     ''
     ]
 
-    f.write('\n'.join(cmt))
-    f.write('from htmltagbase import TagBase\n\n\n')
-
+    specs = []
+    docs = []
     for (link, tag), isEmptyTag in zip(tagList, emptyTagFlags):
         print '----------------------------------------'
         print 'parsing <%s> tag' % tag
@@ -380,14 +404,38 @@ def main():
         tagInfo = getTagInfo(conn, link)
 
         if tag == 'h1':
-            for i in range(1, 7):
-                tag = 'h%d' % i
-                data = genPyClass(tag, isEmptyTag, globalAttrs, eventAttrs, tagInfo)
-                f.write(data.replace('\t', '    '))
+            tags = ['h%d' % i for i in range(1, 7)]
         else:
-            data = genPyClass(tag, isEmptyTag, globalAttrs, eventAttrs, tagInfo)
-            f.write(data.replace('&lt;', '<').replace('&gt;', '>').replace('\x92', "'").replace('\t', '    '))
+            tags = [tag]
+        for tag in tags:
+            specs.append(genTagSpec(tag, isEmptyTag, globalAttrs, eventAttrs, tagInfo))
+            docs.append(genTagDoc(tag, isEmptyTag, globalAttrs, eventAttrs, tagInfo))
+
+    f = open(fname, 'w')
+    f.write('\n'.join(cmt))
+    f.write('import sys\nfrom htmltagbase import *\n\n\n')
+    f.write('# attribute groups shared by many tags\n')
+    f.write('_GROUPS = {\n')
+    f.write(genGroupSpec(globalAttrs, eventAttrs).replace('\t', '    '))
+    f.write('    }\n\n')
+    f.write('# tag name: (empty tag flag, names of the own attributes, ids of the attribute groups)\n')
+    f.write('_TAGS = {\n')
+    f.write(''.join(specs).replace('\t', '    '))
+    f.write('    }\n\n\n')
+    f.write('def _makeTagClass(tagName):\n')
+    f.write('    emptyTag, attrs, groups = _TAGS[tagName]\n')
+    f.write('    groups = tuple([_GROUPS[group] for group in groups])\n')
+    f.write("    return makeTagClass(tagName, emptyTag, attrs, __name__, 'htmltagdocs', groups)\n\n")
+    f.write('sys.modules[__name__] = LazyModule(sys.modules[__name__], _TAGS, _makeTagClass)\n')
+    f.close()
 
+    f = open(docFname, 'w')
+    f.write('\n'.join(cmt))
+    f.write('\n\n# documentation of the classes in htmltags\n')
+    f.write('DOCS = {\n\n')
+    for data in docs:
+        f.write(data.replace('&lt;', '<').replace('&gt;', '>').replace('\x92', "'").replace('\t', '    '))
+    f.write('}\n')
     f.close()
     conn.close()
 